@@ -10,4 +10,18 @@ public sealed class GitLabConfiguration
     /// GitLab Personal Access Token. Can be configured via environment variable GitLab__Token or user secret GitLab:Token
     /// </summary>
     public required string Token { get; init; }
+
+    /// <summary>
+    /// Maximum number of GitLab API requests in flight at once across all metrics services.
+    /// Additional requests queue until a slot frees up. Must be positive.
+    /// </summary>
+    public int MaxConcurrentRequests { get; init; } = 16;
+
+    /// <summary>
+    /// Optional cap on logical GitLab API requests started per second across all metrics services; retries made by
+    /// the resilience pipeline draw no extra tokens. The rate is static: it is not adjusted from GitLab's RateLimit-*
+    /// response headers. Keeps bursts under the instance's rate limit instead of relying on 429 responses.
+    /// Unlimited when not set; must be positive when set.
+    /// </summary>
+    public int? MaxRequestsPerSecond { get; init; }
 }
@@ -7,9 +7,11 @@ public sealed record GitLabPipeline(
     [property: JsonPropertyName("sha")] string Sha,
     [property: JsonPropertyName("ref")] string Ref,
     [property: JsonPropertyName("status")] string Status,
+    [property: JsonPropertyName("source")] string? Source,
     [property: JsonPropertyName("created_at")] DateTimeOffset CreatedAt,
     [property: JsonPropertyName("updated_at")] DateTimeOffset UpdatedAt,
     [property: JsonPropertyName("started_at")] DateTimeOffset? StartedAt,
     [property: JsonPropertyName("duration")] int? Duration,
-    [property: JsonPropertyName("coverage")] string? Coverage
+    [property: JsonPropertyName("coverage")] string? Coverage,
+    [property: JsonPropertyName("web_url")] string? WebUrl
 );
@@ -1,6 +1,12 @@
+using System.Globalization;
 using System.Net;
+using System.Net.Http.Headers;
+using System.Net.Http.Json;
+using System.Runtime.CompilerServices;
 using System.Text.Json;
 
+using Microsoft.Extensions.Caching.Memory;
+
 using KuriousLabs.Management.KPIAnalysis.ApiService.Features.GitLabMetrics.Models.Raw;
 
 using GitLabCommit = KuriousLabs.Management.KPIAnalysis.ApiService.Features.GitLabMetrics.Models.Raw.GitLabCommit;
@@ -66,6 +72,16 @@ public interface IGitLabHttpClient
     /// <returns>List of merge requests</returns>
     Task<IReadOnlyList<GitLabMergeRequest>> GetMergeRequestsAsync(long projectId, DateTimeOffset? updatedAfter = null, CancellationToken cancellationToken = default);
 
+    /// <summary>
+    /// Streams merge requests for a specific project page by page, so callers can start
+    /// per-MR work before the whole listing has been fetched.
+    /// </summary>
+    /// <param name="projectId">The project ID</param>
+    /// <param name="updatedAfter">Optional date filter</param>
+    /// <param name="cancellationToken">Cancellation token</param>
+    /// <returns>Merge requests in the order GitLab returns them (most recently updated first)</returns>
+    IAsyncEnumerable<GitLabMergeRequest> StreamMergeRequestsAsync(long projectId, DateTimeOffset? updatedAfter = null, CancellationToken cancellationToken = default);
+
     /// <summary>
     /// Gets commits for a specific merge request.
     /// </summary>
@@ -80,9 +96,21 @@ public interface IGitLabHttpClient
     /// </summary>
     /// <param name="projectId">The project ID</param>
     /// <param name="updatedAfter">Optional date filter</param>
+    /// <param name="username">Optional filter for pipelines triggered by this user (applied server-side)</param>
     /// <param name="cancellationToken">Cancellation token</param>
     /// <returns>List of pipelines</returns>
-    Task<IReadOnlyList<GitLabPipeline>> GetPipelinesAsync(long projectId, DateTimeOffset? updatedAfter = null, CancellationToken cancellationToken = default);
+    Task<IReadOnlyList<GitLabPipeline>> GetPipelinesAsync(long projectId, DateTimeOffset? updatedAfter = null, string? username = null, CancellationToken cancellationToken = default);
+
+    /// <summary>
+    /// Streams pipelines for a specific project page by page, so callers can start work on the first
+    /// page while later pages are still being fetched.
+    /// </summary>
+    /// <param name="projectId">The project ID</param>
+    /// <param name="updatedAfter">Optional date filter</param>
+    /// <param name="username">Optional filter for pipelines triggered by this user (applied server-side)</param>
+    /// <param name="cancellationToken">Cancellation token</param>
+    /// <returns>Pipelines in the order GitLab returns them (most recently updated first)</returns>
+    IAsyncEnumerable<GitLabPipeline> StreamPipelinesAsync(long projectId, DateTimeOffset? updatedAfter = null, string? username = null, CancellationToken cancellationToken = default);
 
     /// <summary>
     /// Gets all users.
@@ -149,7 +177,7 @@ public interface IGitLabHttpClient
     /// <param name="projectId">The project ID</param>
     /// <param name="mergeRequestIid">The merge request IID</param>
     /// <param name="cancellationToken">Cancellation token</param>
-    /// <returns>List of merge request notes</returns>
+    /// <returns>List of merge request notes across all pages, oldest first</returns>
     Task<IReadOnlyList<GitLabMergeRequestNote>> GetMergeRequestNotesAsync(long projectId, long mergeRequestIid, CancellationToken cancellationToken = default);
 
     /// <summary>
@@ -163,12 +191,12 @@ public interface IGitLabHttpClient
     Task<IReadOnlyList<GitLabEvent>> GetUserEventsAsync(long userId, DateTimeOffset? after = null, DateTimeOffset? before = null, CancellationToken cancellationToken = default);
 
     /// <summary>
-    /// Gets changes (diff stats) for a specific merge request.
+    /// Gets the changed-file count for a specific merge request from its changes_count, without downloading the diff.
     /// </summary>
     /// <param name="projectId">The project ID</param>
     /// <param name="mergeRequestIid">The merge request IID</param>
     /// <param name="cancellationToken">Cancellation token</param>
-    /// <returns>Merge request with changes including additions and deletions</returns>
+    /// <returns>Merge request changes with the changed-file count; GitLab reports no line stats here</returns>
     Task<GitLabMergeRequestChanges?> GetMergeRequestChangesAsync(long projectId, long mergeRequestIid, CancellationToken cancellationToken = default);
 
     /// <summary>
@@ -198,6 +226,16 @@ public interface IGitLabHttpClient
     /// <returns>List of jobs in the pipeline</returns>
     Task<IReadOnlyList<GitLabPipelineJob>> GetPipelineJobsAsync(long projectId, long pipelineId, CancellationToken cancellationToken = default);
 
+    /// <summary>
+    /// Gets all jobs of a project in one paginated listing. Each job carries its pipeline ID, so this replaces
+    /// one <see cref="GetPipelineJobsAsync"/> call per pipeline.
+    /// </summary>
+    /// <param name="projectId">The project ID</param>
+    /// <param name="createdAfter">Optional lower bound on job creation time; paging stops at the first older job</param>
+    /// <param name="cancellationToken">Cancellation token</param>
+    /// <returns>List of jobs, most recent first</returns>
+    Task<IReadOnlyList<GitLabPipelineJob>> GetProjectJobsAsync(long projectId, DateTimeOffset? createdAfter = null, CancellationToken cancellationToken = default);
+
     /// <summary>
     /// Gets branches for a specific project.
     /// </summary>
@@ -218,71 +256,171 @@ public interface IGitLabHttpClient
 /// <summary>
 /// Implementation of GitLab HTTP client for direct API calls.
 /// </summary>
-public sealed class GitLabHttpClient(HttpClient httpClient, ILogger<GitLabHttpClient> logger) : IGitLabHttpClient
+public sealed class GitLabHttpClient(HttpClient httpClient, ILogger<GitLabHttpClient> logger, IMemoryCache? cache = null) : IGitLabHttpClient
 {
     private readonly HttpClient _httpClient = httpClient;
     private readonly ILogger<GitLabHttpClient> _logger = logger;
+    private readonly IMemoryCache? _cache = cache;
     private static readonly JsonSerializerOptions JsonOptions = new()
     {
         PropertyNameCaseInsensitive = true,
         PropertyNamingPolicy = JsonNamingPolicy.SnakeCaseLower
     };
+    private const string TimestampFormat = "yyyy-MM-ddTHH:mm:ssZ";
+    private static readonly TimeSpan CommitStatsCacheDuration = TimeSpan.FromHours(6);
+    private static readonly TimeSpan ConditionalResponseCacheDuration = TimeSpan.FromHours(1);
 
     /// <summary>
     /// Makes a paginated API request to GitLab
     /// </summary>
-    private async Task<List<T>> GetPaginatedAsync<T>(string endpoint, CancellationToken cancellationToken = default, Dictionary<string, string>? queryParams = null)
+    /// <param name="endpoint">The API endpoint relative to the base address</param>
+    /// <param name="cancellationToken">Cancellation token</param>
+    /// <param name="queryParams">Optional query parameters</param>
+    /// <param name="stopWhen">
+    /// Optional predicate for ordered endpoints. The first item matching it (and everything after it) is
+    /// dropped and no further pages are requested.
+    /// </param>
+    /// <param name="revalidate">Whether to cache pages and revalidate them with conditional GETs</param>
+    private async Task<List<T>> GetPaginatedAsync<T>(string endpoint, CancellationToken cancellationToken = default, Dictionary<string, string>? queryParams = null, Func<T, bool>? stopWhen = null, bool revalidate = false)
     {
         var allItems = new List<T>();
+        await foreach (var item in EnumeratePaginatedAsync(endpoint, queryParams, stopWhen, revalidate, cancellationToken))
+        {
+            allItems.Add(item);
+        }
+
+        _logger.LogDebug("Retrieved total of {TotalCount} items from {Endpoint}", allItems.Count, endpoint);
+        return allItems;
+    }
+
+    /// <summary>
+    /// Makes a paginated API request to GitLab, mapping each item as its page arrives so the raw DTO list
+    /// for the whole endpoint is never materialised alongside the mapped results
+    /// </summary>
+    /// <param name="endpoint">The API endpoint relative to the base address</param>
+    /// <param name="map">Maps each DTO to the result type</param>
+    /// <param name="cancellationToken">Cancellation token</param>
+    /// <param name="queryParams">Optional query parameters</param>
+    /// <param name="stopWhen">
+    /// Optional predicate for ordered endpoints. The first item matching it (and everything after it) is
+    /// dropped and no further pages are requested.
+    /// </param>
+    private async Task<List<TResult>> GetPaginatedAsync<T, TResult>(string endpoint, Func<T, TResult> map, CancellationToken cancellationToken = default, Dictionary<string, string>? queryParams = null, Func<T, bool>? stopWhen = null)
+    {
+        var results = new List<TResult>();
+        await foreach (var item in EnumeratePaginatedAsync(endpoint, queryParams, stopWhen, cancellationToken: cancellationToken))
+        {
+            results.Add(map(item));
+        }
+
+        _logger.LogDebug("Retrieved total of {TotalCount} items from {Endpoint}", results.Count, endpoint);
+        return results;
+    }
+
+    /// <summary>
+    /// Streams the items of a paginated GitLab endpoint, yielding each page as soon as it is received
+    /// </summary>
+    /// <param name="endpoint">The API endpoint relative to the base address</param>
+    /// <param name="queryParams">Optional query parameters</param>
+    /// <param name="stopWhen">
+    /// Optional predicate for ordered endpoints. The first item matching it (and everything after it) is
+    /// dropped and no further pages are requested.
+    /// </param>
+    /// <param name="revalidate">
+    /// Whether to cache each page with its ETag / Last-Modified and revalidate it on later calls, so unchanged
+    /// pages come back as an empty 304. Meant for endpoints with stable URLs, such as a merge request's commits.
+    /// </param>
+    /// <param name="cancellationToken">Cancellation token</param>
+    private async IAsyncEnumerable<T> EnumeratePaginatedAsync<T>(string endpoint, Dictionary<string, string>? queryParams = null, Func<T, bool>? stopWhen = null, bool revalidate = false, [EnumeratorCancellation] CancellationToken cancellationToken = default)
+    {
         var page = 1;
         const int perPage = 100; // GitLab's maximum per page
 
-        while (true)
-        {
-            var url = $"{endpoint}?page={page}&per_page={perPage}";
+        var query = string.Empty;
+        string? nextLink = null;
 
-            if (queryParams is not null)
+        if (queryParams is not null)
+        {
+            foreach (var kvp in queryParams)
             {
-                foreach (var kvp in queryParams)
-                {
-                    url += $"&{kvp.Key}={Uri.EscapeDataString(kvp.Value)}";
-                }
+                query += $"&{kvp.Key}={Uri.EscapeDataString(kvp.Value)}";
             }
+        }
 
-            _logger.LogDebug("Making paginated request to: {Url}", url);
+        while (true)
+        {
+            var url = nextLink ?? $"{endpoint}?page={page}&per_page={perPage}{query}";
 
-            var response = await _httpClient.GetAsync(url, cancellationToken);
+            _logger.LogDebug("Making paginated request to: {Url}", url);
 
-            // Check for rate limiting
-            if (response.StatusCode == HttpStatusCode.TooManyRequests)
+            var cacheKey = revalidate && _cache is not null ? $"gitlab:conditional:{url}" : null;
+            ConditionalResponse<PaginatedPage<T>>? cachedPage = null;
+            if (cacheKey is not null && _cache!.TryGetValue(cacheKey, out ConditionalResponse<PaginatedPage<T>>? entry))
             {
-                var retryAfter = response.Headers.RetryAfter?.Delta ?? TimeSpan.FromSeconds(60);
-                _logger.LogWarning("GitLab API rate limit hit. Waiting {RetryAfter} seconds", retryAfter.TotalSeconds);
-                await Task.Delay(retryAfter, cancellationToken);
-                continue; // Retry the same page
+                cachedPage = entry;
             }
 
-            if (!response.IsSuccessStatusCode)
+            // 429s and transient failures are retried (honouring Retry-After) by the client's resilience pipeline
+            using var request = CreateConditionalRequest(url, cachedPage?.ETag, cachedPage?.LastModified);
+            var response = await _httpClient.SendAsync(request, cancellationToken);
+
+            List<T> items;
+            string? pageNextLink;
+            bool hasLinkHeader;
+
+            if (response.StatusCode == HttpStatusCode.NotModified && cachedPage is not null)
             {
-                var errorContent = await response.Content.ReadAsStringAsync(cancellationToken);
-                _logger.LogError("GitLab API request failed with status {StatusCode}: {ErrorContent}", response.StatusCode, errorContent);
-                throw new HttpRequestException($"GitLab API request failed with status {response.StatusCode}: {errorContent}");
+                // 304 responses carry no Link header, so pagination continues from what was cached with the page
+                (items, pageNextLink, hasLinkHeader) = cachedPage.Value;
+                _logger.LogTrace("Page {Page} of {Endpoint} not modified; reusing {ItemCount} cached items", page, endpoint, items.Count);
             }
+            else
+            {
+                if (!response.IsSuccessStatusCode)
+                {
+                    var errorContent = await response.Content.ReadAsStringAsync(cancellationToken);
+                    _logger.LogError("GitLab API request failed with status {StatusCode}: {ErrorContent}", response.StatusCode, errorContent);
+                    throw new HttpRequestException($"GitLab API request failed with status {response.StatusCode}: {errorContent}");
+                }
 
-            // Log rate limit headers for monitoring
-            LogRateLimitHeaders(response);
+                // Log rate limit headers for monitoring
+                LogRateLimitHeaders(response);
 
-            var content = await response.Content.ReadAsStringAsync(cancellationToken);
-            var items = JsonSerializer.Deserialize<List<T>>(content, JsonOptions) ?? new List<T>();
+                // Deserialize straight from the response stream rather than buffering the page into a string first
+                items = await response.Content.ReadFromJsonAsync<List<T>>(JsonOptions, cancellationToken) ?? new List<T>();
+                pageNextLink = GetNextPageLink(response);
+                hasLinkHeader = response.Headers.Contains("Link");
 
-            _logger.LogTrace("Retrieved {ItemCount} items from page {Page}", items.Count, page);
+                var etag = response.Headers.ETag;
+                var lastModified = response.Content.Headers.LastModified;
+                if (cacheKey is not null && (etag is not null || lastModified.HasValue))
+                {
+                    _cache!.Set(
+                        cacheKey,
+                        new ConditionalResponse<PaginatedPage<T>>(etag, lastModified, new PaginatedPage<T>(items, pageNextLink, hasLinkHeader)),
+                        CreateCacheEntryOptions(Math.Max(1, items.Count), ConditionalResponseCacheDuration));
+                }
 
-            allItems.AddRange(items);
+                _logger.LogTrace("Retrieved {ItemCount} items from page {Page}", items.Count, page);
+            }
 
-            // Check if we've reached the last page
-            if (items.Count < perPage)
+            foreach (var item in items)
             {
-                break;
+                if (stopWhen is not null && stopWhen(item))
+                {
+                    _logger.LogDebug("Stopping pagination of {Endpoint} at page {Page}: remaining items are outside the requested range", endpoint, page);
+                    yield break;
+                }
+
+                yield return item;
+            }
+
+            // Prefer the server-provided next link: it is the only way forward for keyset pagination and
+            // is absent on the last page. Fall back to offset paging when the header isn't sent.
+            nextLink = pageNextLink;
+            if (nextLink is null && (items.Count < perPage || hasLinkHeader))
+            {
+                yield break;
             }
 
             page++;
@@ -290,9 +428,107 @@ public sealed class GitLabHttpClient(HttpClient httpClient, ILogger<GitLabHttpCl
             // Add a small delay between requests to be respectful of GitLab API
             await Task.Delay(50, cancellationToken);
         }
+    }
 
-        _logger.LogDebug("Retrieved total of {TotalCount} items from {TotalPages} pages", allItems.Count, page);
-        return allItems;
+    /// <summary>
+    /// GETs a JSON resource, revalidating a previously fetched copy with its ETag / Last-Modified so GitLab can
+    /// answer 304 Not Modified instead of resending an unchanged body. Without a cache this is a plain GET.
+    /// </summary>
+    private async Task<T?> GetJsonConditionalAsync<T>(string url, CancellationToken cancellationToken)
+    {
+        var cacheKey = $"gitlab:conditional:{url}";
+        ConditionalResponse<T>? cached = null;
+        if (_cache is not null && _cache.TryGetValue(cacheKey, out ConditionalResponse<T>? entry))
+        {
+            cached = entry;
+        }
+
+        using var request = CreateConditionalRequest(url, cached?.ETag, cached?.LastModified);
+        using var response = await _httpClient.SendAsync(request, cancellationToken);
+
+        if (response.StatusCode == HttpStatusCode.NotModified && cached is not null)
+        {
+            _logger.LogDebug("{Url} not modified since last fetch; reusing cached response", url);
+            return cached.Value;
+        }
+
+        response.EnsureSuccessStatusCode();
+
+        var value = await response.Content.ReadFromJsonAsync<T>(JsonOptions, cancellationToken);
+
+        var etag = response.Headers.ETag;
+        var lastModified = response.Content.Headers.LastModified;
+        if (_cache is not null && value is not null && (etag is not null || lastModified.HasValue))
+        {
+            var size = value is System.Collections.ICollection collection ? Math.Max(1, collection.Count) : 1;
+            _cache.Set(cacheKey, new ConditionalResponse<T>(etag, lastModified, value), CreateCacheEntryOptions(size, ConditionalResponseCacheDuration));
+        }
+
+        return value;
+    }
+
+    /// <summary>
+    /// Entry options for the shared response cache. Size is counted in cached items (commits, list rows) so the
+    /// process-wide SizeLimit bounds memory roughly by payload volume rather than by entry count.
+    /// </summary>
+    private static MemoryCacheEntryOptions CreateCacheEntryOptions(long size, TimeSpan duration) => new()
+    {
+        Size = size,
+        AbsoluteExpirationRelativeToNow = duration
+    };
+
+    /// <summary>
+    /// Builds a GET request carrying If-None-Match / If-Modified-Since for whichever validators are known
+    /// </summary>
+    private static HttpRequestMessage CreateConditionalRequest(string url, EntityTagHeaderValue? etag, DateTimeOffset? lastModified)
+    {
+        var request = new HttpRequestMessage(HttpMethod.Get, url);
+        if (etag is not null)
+        {
+            request.Headers.IfNoneMatch.Add(etag);
+        }
+        if (lastModified.HasValue)
+        {
+            request.Headers.IfModifiedSince = lastModified;
+        }
+
+        return request;
+    }
+
+    /// <summary>
+    /// Extracts the rel="next" target from GitLab's RFC 5988 Link header, if there is one
+    /// </summary>
+    private static string? GetNextPageLink(HttpResponseMessage response)
+    {
+        if (!response.Headers.TryGetValues("Link", out var linkHeaders))
+        {
+            return null;
+        }
+
+        foreach (var linkHeader in linkHeaders)
+        {
+            foreach (var link in linkHeader.Split(','))
+            {
+                var parts = link.Split(';');
+                var target = parts[0].Trim();
+
+                if (target.StartsWith('<') && target.EndsWith('>')
+                    && parts.Skip(1).Any(part => part.Trim().Equals("rel=\"next\"", StringComparison.OrdinalIgnoreCase)))
+                {
+                    return target[1..^1];
+                }
+            }
+        }
+
+        return null;
+    }
+
+    /// <summary>
+    /// Formats a timestamp as the UTC ISO 8601 string GitLab expects in query parameters
+    /// </summary>
+    private static string FormatTimestamp(DateTimeOffset value)
+    {
+        return value.UtcDateTime.ToString(TimestampFormat, CultureInfo.InvariantCulture);
     }
 
     /// <summary>
@@ -426,12 +662,12 @@ public sealed class GitLabHttpClient(HttpClient httpClient, ILogger<GitLabHttpCl
             Sha = dto.Sha,
             Ref = dto.Ref,
             Status = dto.Status,
-            Source = "push", // Default source, not available in simple DTO
+            Source = dto.Source ?? "push",
             CreatedAt = dto.CreatedAt.DateTime,
             UpdatedAt = dto.UpdatedAt.DateTime,
             StartedAt = dto.StartedAt?.DateTime,
             Coverage = dto.Coverage,
-            WebUrl = string.Empty // Not available in simple DTO
+            WebUrl = dto.WebUrl ?? string.Empty
         };
     }
 
@@ -471,10 +707,7 @@ public sealed class GitLabHttpClient(HttpClient httpClient, ILogger<GitLabHttpCl
             }
 
             // Read and deserialize the response
-            var jsonContent = await response.Content.ReadAsStringAsync(cancellationToken);
-            _logger.LogTrace("GitLab API response: {JsonContent}", jsonContent);
-
-            var contributedProjects = JsonSerializer.Deserialize<List<GitLabContributedProject>>(jsonContent, JsonOptions);
+            var contributedProjects = await response.Content.ReadFromJsonAsync<List<GitLabContributedProject>>(JsonOptions, cancellationToken);
 
             if (contributedProjects is null)
             {
@@ -539,14 +772,16 @@ public sealed class GitLabHttpClient(HttpClient httpClient, ILogger<GitLabHttpCl
         {
             _logger.LogDebug("Fetching ALL projects (including archived) via GitLab API");
 
-            var projectDtos = await GetPaginatedAsync<DTOs.GitLabProject>("projects", cancellationToken,
+            // Keyset pagination avoids deep OFFSET scans on instances with many projects
+            var projects = await GetPaginatedAsync<DTOs.GitLabProject, GitLabProject>("projects", MapToProject, cancellationToken,
                 new Dictionary<string, string>
                 {
-                    {"simple", "true"}
+                    {"simple", "true"},
+                    {"pagination", "keyset"},
+                    {"order_by", "id"},
+                    {"sort", "asc"}
                 });
 
-            var projects = projectDtos.Select(MapToProject).ToList();
-
             _logger.LogInformation("Successfully fetched {ProjectCount} projects (including archived) via GitLab API", projects.Count);
             return projects.AsReadOnly();
         }
@@ -563,15 +798,13 @@ public sealed class GitLabHttpClient(HttpClient httpClient, ILogger<GitLabHttpCl
         {
             _logger.LogDebug("Fetching projects for group {GroupId} via GitLab API", groupId);
 
-            var projectDtos = await GetPaginatedAsync<DTOs.GitLabProject>($"groups/{groupId}/projects", cancellationToken,
+            var projects = await GetPaginatedAsync<DTOs.GitLabProject, GitLabProject>($"groups/{groupId}/projects", MapToProject, cancellationToken,
                 new Dictionary<string, string>
                 {
                     {"simple", "true"},
                     {"archived", "false"}
                 });
 
-            var projects = projectDtos.Select(MapToProject).ToList();
-
             _logger.LogInformation("Successfully fetched {ProjectCount} projects for group {GroupId} via GitLab API", projects.Count, groupId);
             return projects.AsReadOnly();
         }
@@ -606,8 +839,7 @@ public sealed class GitLabHttpClient(HttpClient httpClient, ILogger<GitLabHttpCl
 
             response.EnsureSuccessStatusCode();
 
-            var jsonContent = await response.Content.ReadAsStringAsync(cancellationToken);
-            var projectDto = JsonSerializer.Deserialize<DTOs.GitLabProject>(jsonContent, JsonOptions);
+            var projectDto = await response.Content.ReadFromJsonAsync<DTOs.GitLabProject>(JsonOptions, cancellationToken);
 
             if (projectDto is null)
             {
@@ -647,12 +879,10 @@ public sealed class GitLabHttpClient(HttpClient httpClient, ILogger<GitLabHttpCl
 
             if (since.HasValue)
             {
-                queryParams.Add("since", since.Value.ToString("yyyy-MM-ddTHH:mm:ssZ"));
+                queryParams.Add("since", FormatTimestamp(since.Value));
             }
 
-            var commitDtos = await GetPaginatedAsync<DTOs.GitLabCommit>($"projects/{projectId}/repository/commits", cancellationToken, queryParams);
-
-            var commits = commitDtos.Select(dto => MapToCommit(dto, projectId)).ToList();
+            var commits = await GetPaginatedAsync<DTOs.GitLabCommit, GitLabCommit>($"projects/{projectId}/repository/commits", dto => MapToCommit(dto, projectId), cancellationToken, queryParams);
 
             _logger.LogInformation("Successfully fetched {CommitCount} commits for project {ProjectId} via GitLab API", commits.Count, projectId);
             return commits.AsReadOnly();
@@ -670,22 +900,12 @@ public sealed class GitLabHttpClient(HttpClient httpClient, ILogger<GitLabHttpCl
         {
             _logger.LogDebug("Fetching merge requests for project {ProjectId} via GitLab API", projectId);
 
-            var queryParams = new Dictionary<string, string>
-            {
-                {"state", "all"}, // Include all states (opened, closed, merged)
-                {"order_by", "updated_at"},
-                {"sort", "desc"}
-            };
-
-            if (updatedAfter.HasValue)
+            var mergeRequests = new List<GitLabMergeRequest>();
+            await foreach (var mergeRequest in StreamMergeRequestsAsync(projectId, updatedAfter, cancellationToken))
             {
-                queryParams.Add("updated_after", updatedAfter.Value.ToString("yyyy-MM-ddTHH:mm:ssZ"));
+                mergeRequests.Add(mergeRequest);
             }
 
-            var mrDtos = await GetPaginatedAsync<DTOs.GitLabMergeRequest>($"projects/{projectId}/merge_requests", cancellationToken, queryParams);
-
-            var mergeRequests = mrDtos.Select(MapToMergeRequest).ToList();
-
             _logger.LogInformation("Successfully fetched {MergeRequestCount} merge requests for project {ProjectId} via GitLab API", mergeRequests.Count, projectId);
             return mergeRequests.AsReadOnly();
         }
@@ -696,6 +916,31 @@ public sealed class GitLabHttpClient(HttpClient httpClient, ILogger<GitLabHttpCl
         }
     }
 
+    public async IAsyncEnumerable<GitLabMergeRequest> StreamMergeRequestsAsync(long projectId, DateTimeOffset? updatedAfter = null, [EnumeratorCancellation] CancellationToken cancellationToken = default)
+    {
+        var queryParams = new Dictionary<string, string>
+        {
+            {"state", "all"}, // Include all states (opened, closed, merged)
+            {"order_by", "updated_at"},
+            {"sort", "desc"}
+        };
+
+        if (updatedAfter.HasValue)
+        {
+            queryParams.Add("updated_after", FormatTimestamp(updatedAfter.Value));
+        }
+
+        // Results are ordered by updated_at desc, so stop paging at the first MR older than the window
+        var mergeRequestDtos = EnumeratePaginatedAsync<DTOs.GitLabMergeRequest>($"projects/{projectId}/merge_requests", queryParams,
+            stopWhen: updatedAfter.HasValue ? dto => dto.UpdatedAt < updatedAfter.Value : null,
+            cancellationToken: cancellationToken);
+
+        await foreach (var dto in mergeRequestDtos)
+        {
+            yield return MapToMergeRequest(dto);
+        }
+    }
+
     public async Task<IReadOnlyList<GitLabCommit>> GetMergeRequestCommitsAsync(long projectId, long mergeRequestIid, CancellationToken cancellationToken = default)
     {
         try
@@ -703,11 +948,18 @@ public sealed class GitLabHttpClient(HttpClient httpClient, ILogger<GitLabHttpCl
             _logger.LogDebug("Fetching commits for merge request {MergeRequestIid} in project {ProjectId} via GitLab API", mergeRequestIid, projectId);
 
             // First, get the list of commits in the MR (this endpoint doesn't support with_stats)
-            var commitDtos = await GetPaginatedAsync<DTOs.GitLabCommit>($"projects/{projectId}/merge_requests/{mergeRequestIid}/commits", cancellationToken);
+            var commitDtos = await GetPaginatedAsync<DTOs.GitLabCommit>($"projects/{projectId}/merge_requests/{mergeRequestIid}/commits", cancellationToken, revalidate: true);
 
             // Then fetch detailed stats for each commit using the repository commits endpoint
             var detailedCommitTasks = commitDtos.Select(async dto =>
             {
+                // A commit's stats never change, so they are shared across MRs, services and requests
+                var cacheKey = $"gitlab:commit-stats:{projectId}:{dto.Id}";
+                if (_cache is not null && _cache.TryGetValue(cacheKey, out GitLabCommit? cachedCommit) && cachedCommit is not null)
+                {
+                    return cachedCommit;
+                }
+
                 try
                 {
                     // Fetch individual commit details with stats
@@ -719,10 +971,15 @@ public sealed class GitLabHttpClient(HttpClient httpClient, ILogger<GitLabHttpCl
                         return MapToCommit(dto, projectId); // Return without stats
                     }
 
-                    var jsonContent = await response.Content.ReadAsStringAsync(cancellationToken);
-                    var detailedDto = JsonSerializer.Deserialize<DTOs.GitLabCommit>(jsonContent, JsonOptions);
-                    
-                    return detailedDto is not null ? MapToCommit(detailedDto, projectId) : MapToCommit(dto, projectId);
+                    var detailedDto = await response.Content.ReadFromJsonAsync<DTOs.GitLabCommit>(JsonOptions, cancellationToken);
+                    if (detailedDto is null)
+                    {
+                        return MapToCommit(dto, projectId);
+                    }
+
+                    var detailedCommit = MapToCommit(detailedDto, projectId);
+                    _cache?.Set(cacheKey, detailedCommit, CreateCacheEntryOptions(1, CommitStatsCacheDuration));
+                    return detailedCommit;
                 }
                 catch (Exception ex)
                 {
@@ -761,27 +1018,18 @@ public sealed class GitLabHttpClient(HttpClient httpClient, ILogger<GitLabHttpCl
         }
     }
 
-    public async Task<IReadOnlyList<GitLabPipeline>> GetPipelinesAsync(long projectId, DateTimeOffset? updatedAfter = null, CancellationToken cancellationToken = default)
+    public async Task<IReadOnlyList<GitLabPipeline>> GetPipelinesAsync(long projectId, DateTimeOffset? updatedAfter = null, string? username = null, CancellationToken cancellationToken = default)
     {
         try
         {
             _logger.LogDebug("Fetching pipelines for project {ProjectId} via GitLab API", projectId);
 
-            var queryParams = new Dictionary<string, string>
-            {
-                {"order_by", "updated_at"},
-                {"sort", "desc"}
-            };
-
-            if (updatedAfter.HasValue)
+            var pipelines = new List<GitLabPipeline>();
+            await foreach (var pipeline in StreamPipelinesAsync(projectId, updatedAfter, username, cancellationToken))
             {
-                queryParams.Add("updated_after", updatedAfter.Value.ToString("yyyy-MM-ddTHH:mm:ssZ"));
+                pipelines.Add(pipeline);
             }
 
-            var pipelineDtos = await GetPaginatedAsync<DTOs.GitLabPipeline>($"projects/{projectId}/pipelines", cancellationToken, queryParams);
-
-            var pipelines = pipelineDtos.Select(dto => MapToPipeline(dto, projectId)).ToList();
-
             _logger.LogInformation("Successfully fetched {PipelineCount} pipelines for project {ProjectId} via GitLab API", pipelines.Count, projectId);
             return pipelines.AsReadOnly();
         }
@@ -792,21 +1040,51 @@ public sealed class GitLabHttpClient(HttpClient httpClient, ILogger<GitLabHttpCl
         }
     }
 
+    public async IAsyncEnumerable<GitLabPipeline> StreamPipelinesAsync(long projectId, DateTimeOffset? updatedAfter = null, string? username = null, [EnumeratorCancellation] CancellationToken cancellationToken = default)
+    {
+        var queryParams = new Dictionary<string, string>
+        {
+            {"order_by", "updated_at"},
+            {"sort", "desc"}
+        };
+
+        if (updatedAfter.HasValue)
+        {
+            queryParams.Add("updated_after", FormatTimestamp(updatedAfter.Value));
+        }
+
+        if (!string.IsNullOrEmpty(username))
+        {
+            queryParams.Add("username", username);
+        }
+
+        // Results are ordered by updated_at desc, so stop paging at the first pipeline older than the window
+        var pipelineDtos = EnumeratePaginatedAsync<DTOs.GitLabPipeline>($"projects/{projectId}/pipelines", queryParams,
+            stopWhen: updatedAfter.HasValue ? dto => dto.UpdatedAt < updatedAfter.Value : null,
+            cancellationToken: cancellationToken);
+
+        await foreach (var dto in pipelineDtos)
+        {
+            yield return MapToPipeline(dto, projectId);
+        }
+    }
+
     public async Task<IReadOnlyList<GitLabUser>> GetUsersAsync(CancellationToken cancellationToken = default)
     {
         try
         {
             _logger.LogDebug("Fetching all users via GitLab API");
 
-            var userDtos = await GetPaginatedAsync<DTOs.GitLabUser>("users", cancellationToken,
+            var users = await GetPaginatedAsync<DTOs.GitLabUser, GitLabUser>("users", MapToUser, cancellationToken,
                 new Dictionary<string, string>
                 {
                     {"active", "true"}, // Only active users
-                    {"blocked", "false"} // Exclude blocked users
+                    {"blocked", "false"}, // Exclude blocked users
+                    {"pagination", "keyset"},
+                    {"order_by", "id"},
+                    {"sort", "asc"}
                 });
 
-            var users = userDtos.Select(MapToUser).ToList();
-
             _logger.LogInformation("Successfully fetched {UserCount} users via GitLab API", users.Count);
             return users.AsReadOnly();
         }
@@ -825,17 +1103,6 @@ public sealed class GitLabHttpClient(HttpClient httpClient, ILogger<GitLabHttpCl
 
             var response = await _httpClient.GetAsync($"users/{userId}", cancellationToken);
 
-            // Handle rate limiting
-            if (response.StatusCode == HttpStatusCode.TooManyRequests)
-            {
-                var retryAfter = response.Headers.RetryAfter?.Delta ?? TimeSpan.FromSeconds(60);
-                _logger.LogWarning("GitLab API rate limit hit for user {UserId}. Waiting {RetryAfter} seconds", userId, retryAfter.TotalSeconds);
-                await Task.Delay(retryAfter, cancellationToken);
-
-                // Retry the request
-                response = await _httpClient.GetAsync($"users/{userId}", cancellationToken);
-            }
-
             if (response.StatusCode == HttpStatusCode.NotFound)
             {
                 _logger.LogWarning("User {UserId} not found", userId);
@@ -847,8 +1114,7 @@ public sealed class GitLabHttpClient(HttpClient httpClient, ILogger<GitLabHttpCl
             // Log rate limit headers
             LogRateLimitHeaders(response);
 
-            var content = await response.Content.ReadAsStringAsync(cancellationToken);
-            var userDto = JsonSerializer.Deserialize<DTOs.GitLabUser>(content, JsonOptions);
+            var userDto = await response.Content.ReadFromJsonAsync<DTOs.GitLabUser>(JsonOptions, cancellationToken);
 
             if (userDto is null)
             {
@@ -922,7 +1188,7 @@ public sealed class GitLabHttpClient(HttpClient httpClient, ILogger<GitLabHttpCl
         {
             _logger.LogDebug("Fetching owned projects for user {UserId} via GitLab API", userId);
 
-            var projectDtos = await GetPaginatedAsync<DTOs.GitLabProject>($"users/{userId}/projects", cancellationToken,
+            var projects = await GetPaginatedAsync<DTOs.GitLabProject, GitLabProject>($"users/{userId}/projects", MapToProject, cancellationToken,
                 new Dictionary<string, string>
                 {
                     {"simple", "true"},
@@ -930,8 +1196,6 @@ public sealed class GitLabHttpClient(HttpClient httpClient, ILogger<GitLabHttpCl
                     {"archived", "false"}
                 });
 
-            var projects = projectDtos.Select(MapToProject).ToList();
-
             _logger.LogInformation("Successfully fetched {ProjectCount} owned projects for user {UserId} via GitLab API", projects.Count, userId);
             return projects.AsReadOnly();
         }
@@ -994,12 +1258,10 @@ public sealed class GitLabHttpClient(HttpClient httpClient, ILogger<GitLabHttpCl
 
             if (since.HasValue)
             {
-                queryParams.Add("since", since.Value.ToString("yyyy-MM-ddTHH:mm:ssZ"));
+                queryParams.Add("since", FormatTimestamp(since.Value));
             }
 
-            var commitDtos = await GetPaginatedAsync<DTOs.GitLabCommit>($"projects/{projectId}/repository/commits", cancellationToken, queryParams);
-
-            var commits = commitDtos.Select(dto => MapToCommit(dto, projectId)).ToList();
+            var commits = await GetPaginatedAsync<DTOs.GitLabCommit, GitLabCommit>($"projects/{projectId}/repository/commits", dto => MapToCommit(dto, projectId), cancellationToken, queryParams);
 
             _logger.LogDebug("Successfully fetched {CommitCount} commits by user {UserEmail} for project {ProjectId} via GitLab API", commits.Count, userEmail, projectId);
             return commits.AsReadOnly();
@@ -1017,12 +1279,14 @@ public sealed class GitLabHttpClient(HttpClient httpClient, ILogger<GitLabHttpCl
         {
             _logger.LogDebug("Fetching merge request notes for project {ProjectId}, MR {MergeRequestIid}", projectId, mergeRequestIid);
 
-            var url = $"projects/{projectId}/merge_requests/{mergeRequestIid}/notes";
-            var response = await _httpClient.GetAsync(url, cancellationToken);
-            response.EnsureSuccessStatusCode();
-
-            var content = await response.Content.ReadAsStringAsync(cancellationToken);
-            var notes = JsonSerializer.Deserialize<List<GitLabMergeRequestNote>>(content, JsonOptions) ?? new List<GitLabMergeRequestNote>();
+            // Several metrics services read the same MR's notes, so revalidate pages instead of re-downloading them
+            // Have GitLab return the notes oldest first (its default is newest first) so callers can rely on the order
+            var queryParams = new Dictionary<string, string>
+            {
+                { "order_by", "created_at" },
+                { "sort", "asc" }
+            };
+            var notes = await GetPaginatedAsync<GitLabMergeRequestNote>($"projects/{projectId}/merge_requests/{mergeRequestIid}/notes", cancellationToken, queryParams, revalidate: true);
 
             _logger.LogDebug("Retrieved {NoteCount} merge request notes for project {ProjectId}, MR {MergeRequestIid}", notes.Count, projectId, mergeRequestIid);
             return notes.AsReadOnly();
@@ -1055,10 +1319,8 @@ public sealed class GitLabHttpClient(HttpClient httpClient, ILogger<GitLabHttpCl
                 queryParams.Add("before", before.Value.ToString("yyyy-MM-dd"));
             }
 
-            var eventDtos = await GetPaginatedAsync<DTOs.GitLabEvent>($"users/{userId}/events", cancellationToken, queryParams);
-
-            // Filter to only push events and map to domain model
-            var events = eventDtos.Select(MapToEvent).ToList();
+            // Map to the domain model as each page arrives
+            var events = await GetPaginatedAsync<DTOs.GitLabEvent, GitLabEvent>($"users/{userId}/events", MapToEvent, cancellationToken, queryParams);
 
             _logger.LogInformation("Successfully fetched {EventCount} push events for user {UserId}", events.Count, userId);
             return events.AsReadOnly();
@@ -1111,55 +1373,39 @@ public sealed class GitLabHttpClient(HttpClient httpClient, ILogger<GitLabHttpCl
         {
             _logger.LogDebug("Fetching changes for MR {MergeRequestIid} in project {ProjectId}", mergeRequestIid, projectId);
 
-            var url = $"projects/{projectId}/merge_requests/{mergeRequestIid}/changes";
-            var response = await _httpClient.GetAsync(url, cancellationToken);
-
-            if (response.StatusCode == HttpStatusCode.NotFound)
+            // The MR detail carries changes_count, so the file count needs no diff download. A merged MR's detail
+            // no longer changes, so revalidate a cached copy and let repeat lookups come back as 304 Not Modified.
+            DTOs.GitLabMergeRequest? mergeRequestDto;
+            try
+            {
+                mergeRequestDto = await GetJsonConditionalAsync<DTOs.GitLabMergeRequest>($"projects/{projectId}/merge_requests/{mergeRequestIid}", cancellationToken);
+            }
+            catch (HttpRequestException ex) when (ex.StatusCode == HttpStatusCode.NotFound)
             {
                 _logger.LogWarning("MR {MergeRequestIid} not found in project {ProjectId}", mergeRequestIid, projectId);
                 return null;
             }
 
-            response.EnsureSuccessStatusCode();
-
-            var content = await response.Content.ReadAsStringAsync(cancellationToken);
-            var changesDto = JsonSerializer.Deserialize<DTOs.GitLabMergeRequestChangesDto>(content, JsonOptions);
-
-            if (changesDto?.Changes is null)
+            List<GitLabMergeRequestChange>? changes = null;
+            var fileCount = ParseChangesCount(mergeRequestDto?.ChangesCount);
+            if (fileCount is null)
             {
-                _logger.LogDebug("No changes found for MR {MergeRequestIid} in project {ProjectId}", mergeRequestIid, projectId);
-                return new GitLabMergeRequestChanges
-                {
-                    Additions = 0,
-                    Deletions = 0,
-                    Total = 0,
-                    Changes = new List<GitLabMergeRequestChange>()
-                };
+                // changes_count is null until GitLab has computed the MR diff; only then fall back to the file list
+                changes = await GetMergeRequestChangedFilesAsync(projectId, mergeRequestIid, cancellationToken);
+                fileCount = changes?.Count ?? 0;
             }
 
-            // Map changes and calculate stats
-            var changes = changesDto.Changes.Select(c => new GitLabMergeRequestChange
-            {
-                OldPath = c.OldPath,
-                NewPath = c.NewPath,
-                NewFile = c.NewFile,
-                RenamedFile = c.RenamedFile,
-                DeletedFile = c.DeletedFile
-            }).ToList();
-
-            // Note: GitLab API doesn't always provide per-file additions/deletions in the changes endpoint
-            // We'll return the changes list but stats will need to be calculated from commits
-            var result = new GitLabMergeRequestChanges
+            _logger.LogDebug("Successfully fetched {FileCount} changed files for MR {MergeRequestIid} in project {ProjectId}", fileCount, mergeRequestIid, projectId);
+
+            // Note: neither endpoint provides line additions/deletions, so line stats stay at zero
+            return new GitLabMergeRequestChanges
             {
                 Additions = 0,
                 Deletions = 0,
                 Total = 0,
+                FileCount = fileCount.Value,
                 Changes = changes
             };
-
-            _logger.LogDebug("Successfully fetched {ChangeCount} file changes for MR {MergeRequestIid} in project {ProjectId}", 
-                changes.Count, mergeRequestIid, projectId);
-            return result;
         }
         catch (Exception ex)
         {
@@ -1168,13 +1414,44 @@ public sealed class GitLabHttpClient(HttpClient httpClient, ILogger<GitLabHttpCl
         }
     }
 
+    /// <summary>
+    /// Fallback for MRs without a changes_count: lists the changed files from /changes. The DTO binds only paths
+    /// and flags, so the per-file diff text is skipped during deserialization.
+    /// </summary>
+    private async Task<List<GitLabMergeRequestChange>?> GetMergeRequestChangedFilesAsync(long projectId, long mergeRequestIid, CancellationToken cancellationToken)
+    {
+        var changesDto = await GetJsonConditionalAsync<DTOs.GitLabMergeRequestChangesDto>($"projects/{projectId}/merge_requests/{mergeRequestIid}/changes", cancellationToken);
+
+        return changesDto?.Changes?.Select(c => new GitLabMergeRequestChange
+        {
+            OldPath = c.OldPath,
+            NewPath = c.NewPath,
+            NewFile = c.NewFile,
+            RenamedFile = c.RenamedFile,
+            DeletedFile = c.DeletedFile
+        }).ToList();
+    }
+
+    /// <summary>
+    /// Parses GitLab's string changes_count, which is capped with a "+" suffix (e.g. "1000+") on very large MRs
+    /// </summary>
+    private static int? ParseChangesCount(string? changesCount)
+    {
+        if (string.IsNullOrEmpty(changesCount))
+        {
+            return null;
+        }
+
+        return int.TryParse(changesCount.AsSpan().TrimEnd('+'), NumberStyles.None, CultureInfo.InvariantCulture, out var count) ? count : null;
+    }
+
     public async Task<IReadOnlyList<GitLabDiscussion>> GetMergeRequestDiscussionsAsync(long projectId, long mergeRequestIid, CancellationToken cancellationToken = default)
     {
         try
         {
             _logger.LogDebug("Fetching discussions for MR {MergeRequestIid} in project {ProjectId}", mergeRequestIid, projectId);
 
-            var discussions = await GetPaginatedAsync<GitLabDiscussion>($"projects/{projectId}/merge_requests/{mergeRequestIid}/discussions", cancellationToken);
+            var discussions = await GetPaginatedAsync<GitLabDiscussion>($"projects/{projectId}/merge_requests/{mergeRequestIid}/discussions", cancellationToken, revalidate: true);
 
             _logger.LogDebug("Successfully fetched {DiscussionCount} discussions for MR {MergeRequestIid} in project {ProjectId}", 
                 discussions.Count, mergeRequestIid, projectId);
@@ -1193,25 +1470,19 @@ public sealed class GitLabHttpClient(HttpClient httpClient, ILogger<GitLabHttpCl
         {
             _logger.LogDebug("Fetching approvals for MR {MergeRequestIid} in project {ProjectId}", mergeRequestIid, projectId);
 
+            // Approvals of merged MRs rarely change, so revalidate a cached copy instead of re-downloading it
             var url = $"projects/{projectId}/merge_requests/{mergeRequestIid}/approvals";
-            var response = await _httpClient.GetAsync(url, cancellationToken);
-
-            if (response.StatusCode == HttpStatusCode.NotFound)
+            GitLabMergeRequestApprovals? approvals;
+            try
             {
-                _logger.LogWarning("Approvals not found for MR {MergeRequestIid} in project {ProjectId} (may not be available in this GitLab edition)", mergeRequestIid, projectId);
-                return null;
+                approvals = await GetJsonConditionalAsync<GitLabMergeRequestApprovals>(url, cancellationToken);
             }
-
-            if (!response.IsSuccessStatusCode)
+            catch (HttpRequestException ex) when (ex.StatusCode == HttpStatusCode.NotFound)
             {
-                _logger.LogWarning("Failed to fetch approvals for MR {MergeRequestIid} in project {ProjectId}: {StatusCode}", 
-                    mergeRequestIid, projectId, response.StatusCode);
+                _logger.LogWarning("Approvals not found for MR {MergeRequestIid} in project {ProjectId} (may not be available in this GitLab edition)", mergeRequestIid, projectId);
                 return null;
             }
 
-            var content = await response.Content.ReadAsStringAsync(cancellationToken);
-            var approvals = JsonSerializer.Deserialize<GitLabMergeRequestApprovals>(content, JsonOptions);
-
             _logger.LogDebug("Successfully fetched approvals for MR {MergeRequestIid} in project {ProjectId}", mergeRequestIid, projectId);
             return approvals;
         }
@@ -1228,9 +1499,7 @@ public sealed class GitLabHttpClient(HttpClient httpClient, ILogger<GitLabHttpCl
         {
             _logger.LogDebug("Fetching jobs for pipeline {PipelineId} in project {ProjectId}", pipelineId, projectId);
 
-            var jobDtos = await GetPaginatedAsync<DTOs.GitLabPipelineJob>($"projects/{projectId}/pipelines/{pipelineId}/jobs", cancellationToken);
-
-            var jobs = jobDtos.Select(dto => MapToPipelineJob(dto, projectId)).ToList();
+            var jobs = await GetPaginatedAsync<DTOs.GitLabPipelineJob, GitLabPipelineJob>($"projects/{projectId}/pipelines/{pipelineId}/jobs", dto => MapToPipelineJob(dto, projectId), cancellationToken);
 
             _logger.LogDebug("Successfully fetched {JobCount} jobs for pipeline {PipelineId} in project {ProjectId}", 
                 jobs.Count, pipelineId, projectId);
@@ -1243,6 +1512,33 @@ public sealed class GitLabHttpClient(HttpClient httpClient, ILogger<GitLabHttpCl
         }
     }
 
+    public async Task<IReadOnlyList<GitLabPipelineJob>> GetProjectJobsAsync(long projectId, DateTimeOffset? createdAfter = null, CancellationToken cancellationToken = default)
+    {
+        try
+        {
+            _logger.LogDebug("Fetching jobs for project {ProjectId}", projectId);
+
+            // Jobs are listed newest first (by ID), so stop paging at the first job created before the window
+            var jobs = await GetPaginatedAsync<DTOs.GitLabPipelineJob, GitLabPipelineJob>($"projects/{projectId}/jobs", dto => MapToPipelineJob(dto, projectId), cancellationToken,
+                new Dictionary<string, string>
+                {
+                    {"pagination", "keyset"},
+                    {"order_by", "id"},
+                    {"sort", "desc"}
+                },
+                stopWhen: createdAfter.HasValue ? dto => dto.CreatedAt < createdAfter.Value : null);
+
+            _logger.LogDebug("Successfully fetched {JobCount} jobs for project {ProjectId}", jobs.Count, projectId);
+            return jobs.AsReadOnly();
+        }
+        catch (Exception ex)
+        {
+            // A failure on a later page must not pass for a project without jobs, so let the caller decide
+            _logger.LogError(ex, "Failed to fetch jobs for project {ProjectId}", projectId);
+            throw;
+        }
+    }
+
     public async Task<IReadOnlyList<DTOs.GitLabBranch>> GetBranchesAsync(long projectId, CancellationToken cancellationToken = default)
     {
         try
@@ -1303,4 +1599,14 @@ public sealed class GitLabHttpClient(HttpClient httpClient, ILogger<GitLabHttpCl
             WebUrl = dto.WebUrl
         };
     }
+
+    /// <summary>
+    /// A cached response body together with the validators needed to revalidate it
+    /// </summary>
+    private sealed record ConditionalResponse<T>(EntityTagHeaderValue? ETag, DateTimeOffset? LastModified, T Value);
+
+    /// <summary>
+    /// One page of a paginated endpoint, with the pagination state needed to continue past it from the cache
+    /// </summary>
+    private sealed record PaginatedPage<T>(List<T> Items, string? NextLink, bool HasLinkHeader);
 }
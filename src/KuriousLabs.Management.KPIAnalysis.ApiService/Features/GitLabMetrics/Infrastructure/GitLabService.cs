@@ -171,7 +171,7 @@ public sealed class GitLabService : IGitLabService
     {
         try
         {
-            var pipelines = await _gitLabHttpClient.GetPipelinesAsync(projectId, updatedAfter, cancellationToken);
+            var pipelines = await _gitLabHttpClient.GetPipelinesAsync(projectId, updatedAfter, cancellationToken: cancellationToken);
 
             var rawPipelines = new List<RawPipeline>();
 
@@ -189,12 +189,12 @@ public sealed class GitLabService : IGitLabService
                         Status = pipeline.Status ?? "unknown",
                         AuthorUserId = pipeline.User?.Id ?? 0,
                         AuthorName = pipeline.User?.Name ?? "Unknown",
-                        TriggerSource = "unknown", // Not available in our model
+                        TriggerSource = pipeline.Source ?? "unknown",
                         CreatedAt = pipeline.CreatedAt ?? DateTime.UtcNow,
                         UpdatedAt = pipeline.UpdatedAt ?? DateTime.UtcNow,
-                        StartedAt = null, // Not available in our model
-                        FinishedAt = null, // Not available in our model
-                        DurationSec = 0, // Not available in our model
+                        StartedAt = pipeline.StartedAt,
+                        FinishedAt = null, // Not in the pipeline list payload
+                        DurationSec = 0, // Not in the pipeline list payload
                         Environment = null, // Would need to check pipeline jobs for environment
                         IngestedAt = DateTime.UtcNow
                     };
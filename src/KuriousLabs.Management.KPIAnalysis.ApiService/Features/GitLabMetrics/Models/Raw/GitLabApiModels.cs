@@ -440,6 +440,16 @@ public class GitLabPipeline
     /// </summary>
     public DateTime? StartedAt { get; set; }
 
+    /// <summary>
+    /// When finished. Not part of the pipeline list payload; derived from the pipeline's jobs when needed.
+    /// </summary>
+    public DateTime? FinishedAt { get; set; }
+
+    /// <summary>
+    /// The pipeline duration in seconds. Not part of the pipeline list payload; derived from the pipeline's jobs when needed.
+    /// </summary>
+    public int? Duration { get; set; }
+
     /// <summary>
     /// Coverage percentage from pipeline reports.
     /// </summary>
@@ -752,6 +762,11 @@ public class GitLabMergeRequestChanges
     /// </summary>
     public int Total { get; set; }
 
+    /// <summary>
+    /// Number of changed files, from GitLab's changes_count (capped values such as "1000+" count as 1000).
+    /// </summary>
+    public int FileCount { get; set; }
+
     /// <summary>
     /// List of changed files with individual stats.
     /// </summary>
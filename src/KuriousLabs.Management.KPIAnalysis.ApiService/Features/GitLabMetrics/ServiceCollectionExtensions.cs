@@ -1,7 +1,11 @@
+using System.Net;
 using System.Net.Http.Headers;
+using System.Threading.RateLimiting;
 
 using Microsoft.Extensions.Options;
 
+using Polly;
+
 using KuriousLabs.Management.KPIAnalysis.ApiService.Configuration;
 using KuriousLabs.Management.KPIAnalysis.ApiService.Features.GitLabMetrics.Configuration;
 using KuriousLabs.Management.KPIAnalysis.ApiService.Features.GitLabMetrics.HealthChecks;
@@ -22,9 +26,23 @@ internal static class ServiceCollectionExtensions
         builder.Services.AddHealthChecks().AddGitLabHealthCheck();
 
         // Add configurations
-        builder.Services.Configure<GitLabConfiguration>(builder.Configuration.GetSection(GitLabConfiguration.SectionName));
+        // The limits feed the resilience limiters, which throw when built with a non-positive value; fail at startup instead
+        builder.Services.AddOptions<GitLabConfiguration>()
+            .Bind(builder.Configuration.GetSection(GitLabConfiguration.SectionName))
+            .Validate(configuration => configuration.MaxConcurrentRequests > 0, "GitLab:MaxConcurrentRequests must be greater than zero.")
+            .Validate(configuration => configuration.MaxRequestsPerSecond is null or > 0, "GitLab:MaxRequestsPerSecond must be greater than zero when set.")
+            .ValidateOnStart();
         builder.Services.Configure<MetricsConfiguration>(builder.Configuration.GetSection(MetricsConfiguration.SectionName));
 
+        // Shared across requests so immutable GitLab data (e.g. commit stats) is fetched once per process.
+        // Bounded so a long-running host cannot grow without limit; entries are sized in cached items
+        // (commits, list rows), and once the limit is reached new entries are dropped until compaction.
+        builder.Services.AddMemoryCache(options =>
+        {
+            options.SizeLimit = 200_000;
+            options.CompactionPercentage = 0.25;
+        });
+
         // Add services
         // We'll keep CommitTimeAnalysis and shared infra always registered.
         builder.Services.AddScoped<ICommitTimeAnalysisService, CommitTimeAnalysisService>();
@@ -39,7 +57,7 @@ internal static class ServiceCollectionExtensions
         builder.Services.AddScoped<IUserMetricsAggregationService, UserMetricsAggregationService>();
 
         // Add HTTP client for GitLab API calls
-        builder.Services
+        var httpClientBuilder = builder.Services
             .AddHttpClient<IGitLabHttpClient, GitLabHttpClient>((sp, client) =>
             {
                 var options = sp.GetRequiredService<IOptions<GitLabConfiguration>>();
@@ -50,9 +68,50 @@ internal static class ServiceCollectionExtensions
                 // Add GitLab-specific headers
                 client.DefaultRequestHeaders.Add("User-Agent", "GitLabMetricsAnalyzer/1.0");
 
-                // Set reasonable timeout for GitLab API calls
-                client.Timeout = TimeSpan.FromMinutes(2);
+                // No client-level timeout: it would also count time spent queued behind the request-rate and
+                // concurrency limiters below, turning large fan-outs into timeouts. The resilience pipeline's
+                // attempt and total request timeouts bound each call once it is allowed to run.
+                client.Timeout = Timeout.InfiniteTimeSpan;
+
+                // Multiplex concurrent requests over HTTP/2 where GitLab offers it, falling back to HTTP/1.1 otherwise
+                client.DefaultRequestVersion = HttpVersion.Version20;
+                client.DefaultVersionPolicy = HttpVersionPolicy.RequestVersionOrLower;
             })
+            // Share one long-lived connection pool across all scopes so every metrics service
+            // reuses the same keep-alive connections (and TLS sessions) to the GitLab host.
+            // DNS changes are still picked up through PooledConnectionLifetime.
+            .ConfigurePrimaryHttpMessageHandler(() => new SocketsHttpHandler
+            {
+                PooledConnectionLifetime = TimeSpan.FromMinutes(15),
+                PooledConnectionIdleTimeout = TimeSpan.FromMinutes(2),
+                AutomaticDecompression = DecompressionMethods.GZip | DecompressionMethods.Deflate, // Ask GitLab for compressed JSON; list payloads (pipelines, jobs, notes) shrink severalfold
+                // Open another HTTP/2 connection instead of queueing once a connection's stream limit is reached
+                EnableMultipleHttp2Connections = true
+            })
+            .SetHandlerLifetime(Timeout.InfiniteTimeSpan);
+
+        // Registered before the standard handler so it is the outermost handler: each logical request draws from one
+        // process-wide token bucket before queueing for a concurrency permit, and the wait counts against no timeout
+        httpClientBuilder.AddResilienceHandler("gitlab-request-rate", (pipeline, context) =>
+        {
+            var configuration = context.ServiceProvider.GetRequiredService<IOptions<GitLabConfiguration>>().Value;
+            if (configuration.MaxRequestsPerSecond is not { } requestsPerSecond)
+            {
+                return;
+            }
+
+            pipeline.AddRateLimiter(new TokenBucketRateLimiter(new TokenBucketRateLimiterOptions
+            {
+                TokenLimit = requestsPerSecond,
+                TokensPerPeriod = requestsPerSecond,
+                ReplenishmentPeriod = TimeSpan.FromSeconds(1),
+                QueueProcessingOrder = QueueProcessingOrder.OldestFirst,
+                QueueLimit = int.MaxValue,
+                AutoReplenishment = true
+            }));
+        });
+
+        httpClientBuilder
             .AddStandardResilienceHandler(options =>
             {
                 // Configure retry policy for GitLab API
@@ -60,6 +119,7 @@ internal static class ServiceCollectionExtensions
                 options.Retry.BackoffType = Polly.DelayBackoffType.Exponential;
                 options.Retry.UseJitter = true;
                 options.Retry.Delay = TimeSpan.FromSeconds(1);
+                options.Retry.ShouldRetryAfterHeader = true; // Honour GitLab's Retry-After on 429/503
 
                 // Configure circuit breaker for GitLab API  
                 options.CircuitBreaker.FailureRatio = 0.3; // Break if 30% of requests fail
@@ -68,6 +128,14 @@ internal static class ServiceCollectionExtensions
 
                 // Configure total request timeout
                 options.TotalRequestTimeout.Timeout = TimeSpan.FromMinutes(5);
+            })
+            .Configure((options, sp) =>
+            {
+                // One process-wide concurrency limit for every GitLab call, so nested per-project and
+                // per-MR fan-outs share a single bounded pool of in-flight requests instead of multiplying
+                var configuration = sp.GetRequiredService<IOptions<GitLabConfiguration>>().Value;
+                options.RateLimiter.DefaultRateLimiterOptions.PermitLimit = configuration.MaxConcurrentRequests;
+                options.RateLimiter.DefaultRateLimiterOptions.QueueLimit = int.MaxValue;
             });
 
         return builder;
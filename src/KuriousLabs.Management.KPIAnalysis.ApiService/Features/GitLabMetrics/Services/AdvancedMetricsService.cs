@@ -1,3 +1,5 @@
+using System.Text.RegularExpressions;
+
 using Microsoft.Extensions.Options;
 
 using KuriousLabs.Management.KPIAnalysis.ApiService.Configuration;
@@ -15,6 +17,12 @@ public sealed class AdvancedMetricsService : IAdvancedMetricsService
     private readonly ILogger<AdvancedMetricsService> _logger;
     private readonly MetricsConfiguration _configuration;
 
+    // Matches both draft/WIP system notes and their "unmarked" counterparts in one scan; the optional "un" group
+    // tells them apart
+    private static readonly Regex DraftStateChangeRegex = new(
+        @"(un)?marked as (?:a \*\*Work In Progress\*\*|\*\*draft\*\*)",
+        RegexOptions.IgnoreCase | RegexOptions.Compiled);
+
     public AdvancedMetricsService(
         IGitLabHttpClient gitLabHttpClient,
         ILogger<AdvancedMetricsService> logger,
@@ -46,6 +54,7 @@ public sealed class AdvancedMetricsService : IAdvancedMetricsService
 
         var windowEnd = DateTime.UtcNow;
         var windowStart = windowEnd.AddDays(-windowDays);
+        var windowStartOffset = new DateTimeOffset(windowStart, TimeSpan.Zero);
 
         _logger.LogDebug("Fetching data for user {UserId} from {WindowStart} to {WindowEnd}",
             userId, windowStart, windowEnd);
@@ -67,21 +76,27 @@ public sealed class AdvancedMetricsService : IAdvancedMetricsService
         {
             try
             {
-                var mergeRequests = await _gitLabHttpClient.GetMergeRequestsAsync(
+                // A project's MRs and commits are independent, so request both at once
+                var mergeRequestsTask = _gitLabHttpClient.GetMergeRequestsAsync(
+                    project.Id,
+                    windowStartOffset,
+                    cancellationToken);
+
+                var commitsTask = _gitLabHttpClient.GetCommitsAsync(
                     project.Id,
-                    new DateTimeOffset(windowStart),
+                    windowStartOffset,
                     cancellationToken);
 
+                await Task.WhenAll(mergeRequestsTask, commitsTask);
+                var mergeRequests = await mergeRequestsTask;
+
                 // Filter MRs within time window (created or updated within window)
                 var mrsInWindow = mergeRequests
                     .Where(mr => (mr.CreatedAt.HasValue && mr.CreatedAt.Value >= windowStart && mr.CreatedAt.Value <= windowEnd) ||
                                  (mr.UpdatedAt.HasValue && mr.UpdatedAt.Value >= windowStart && mr.UpdatedAt.Value <= windowEnd))
                     .ToList();
 
-                var commits = await _gitLabHttpClient.GetCommitsAsync(
-                    project.Id,
-                    new DateTimeOffset(windowStart),
-                    cancellationToken);
+                var commits = await commitsTask;
 
                 var commitsInWindow = commits
                     .Where(c => c.CommittedDate.HasValue && c.CommittedDate.Value >= windowStart && c.CommittedDate.Value <= windowEnd)
@@ -115,13 +130,20 @@ public sealed class AdvancedMetricsService : IAdvancedMetricsService
         _logger.LogInformation("Processing {MrCount} merge requests and {CommitCount} commits",
             allMergeRequests.Count, allCommits.Count);
 
+        // Fetch each MR's notes, and each user MR's discussions and commits, once and share them across the metrics
+        var userMrs = allMergeRequests.Where(mr => mr.Author?.Id == userId).ToList();
+        var notesTask = FetchMergeRequestNotesAsync(projectDataList, cancellationToken);
+        var reviewActivitiesTask = FetchReviewActivitiesAsync(userMrs, cancellationToken);
+        await Task.WhenAll(notesTask, reviewActivitiesTask);
+        var notesByMergeRequest = await notesTask;
+        var reviewActivities = await reviewActivitiesTask;
+
         // Calculate each metric
         var busFactor = await CalculateBusFactorAsync(userId, projectDataList, cancellationToken);
-        var responseTimeDistribution = await CalculateResponseTimeDistributionAsync(userId, projectDataList, cancellationToken);
+        var responseTimeDistribution = CalculateResponseTimeDistribution(userId, notesByMergeRequest);
         var batchSize = CalculateBatchSize(userId, allMergeRequests, projectDataList);
-        var draftDuration = await CalculateDraftDurationAsync(userId, allMergeRequests, projectDataList, cancellationToken);
-        var iterationCount = await CalculateIterationCountAsync(userId, allMergeRequests, projectDataList, cancellationToken);
-        var idleTimeInReview = await CalculateIdleTimeInReviewAsync(userId, allMergeRequests, projectDataList, cancellationToken);
+        var draftDuration = CalculateDraftDuration(userMrs, notesByMergeRequest);
+        var (iterationCount, idleTimeInReview) = CalculateReviewCycleMetrics(userId, userMrs.Count, reviewActivities);
         var crossTeamCollab = await CalculateCrossTeamCollaborationAsync(userId, allMergeRequests, projectDataList, cancellationToken);
 
         // Build project summaries
@@ -198,8 +220,10 @@ public sealed class AdvancedMetricsService : IAdvancedMetricsService
             return Task.FromResult(new BusFactorMetric { GiniCoefficient = 0, DeveloperCount = developerFileChanges.Count, Top3Percentage = 0 });
         }
 
-        var sortedChanges = developerFileChanges.Values.OrderBy(x => x).ToList();
-        var n = sortedChanges.Count;
+        // Sort once; the Gini sum and the top-3 share are both read from this array
+        var sortedChanges = developerFileChanges.Values.ToArray();
+        Array.Sort(sortedChanges);
+        var n = sortedChanges.Length;
         decimal giniNumerator = 0;
 
         for (var i = 0; i < n; i++)
@@ -210,7 +234,7 @@ public sealed class AdvancedMetricsService : IAdvancedMetricsService
         var giniCoefficient = giniNumerator / (n * totalChanges);
 
         // Calculate percentage by top 3 developers
-        var top3Changes = developerFileChanges.Values.OrderByDescending(x => x).Take(3).Sum();
+        var top3Changes = sortedChanges.TakeLast(3).Sum();
         var top3Percentage = totalChanges > 0 ? (decimal)top3Changes / totalChanges * 100 : 0;
 
         return Task.FromResult(new BusFactorMetric
@@ -221,42 +245,22 @@ public sealed class AdvancedMetricsService : IAdvancedMetricsService
         });
     }
 
-    private async Task<ResponseTimeDistributionMetric> CalculateResponseTimeDistributionAsync(
+    private ResponseTimeDistributionMetric CalculateResponseTimeDistribution(
         long userId,
-        IEnumerable<ProjectData> projectDataList,
-        CancellationToken cancellationToken)
+        IReadOnlyDictionary<(long ProjectId, long Iid), IReadOnlyList<GitLabMergeRequestNote>> notesByMergeRequest)
     {
         var hourDistribution = Enumerable.Range(0, 24).ToDictionary(h => h, h => 0);
         var totalResponses = 0;
 
-        foreach (var project in projectDataList)
+        foreach (var notes in notesByMergeRequest.Values)
         {
-            foreach (var mr in project.MergeRequests)
+            // Review comments are the user's own, non-system notes
+            foreach (var note in notes)
             {
-                try
-                {
-                    // Get discussions/notes for the MR
-                    var notes = await _gitLabHttpClient.GetMergeRequestNotesAsync(
-                        project.ProjectId,
-                        mr.Iid,
-                        cancellationToken);
-
-                    // Filter to review comments (not system notes, from the user)
-                    var userReviewComments = notes
-                        .Where(n => n.Author?.Id == userId && !n.System && n.CreatedAt.HasValue)
-                        .ToList();
-
-                    foreach (var comment in userReviewComments)
-                    {
-                        var hour = comment.CreatedAt!.Value.Hour;
-                        hourDistribution[hour]++;
-                        totalResponses++;
-                    }
-                }
-                catch (Exception ex)
+                if (note.Author?.Id == userId && !note.System && note.CreatedAt.HasValue)
                 {
-                    _logger.LogDebug(ex, "Failed to fetch notes for MR {MrIid} in project {ProjectId}",
-                        mr.Iid, project.ProjectId);
+                    hourDistribution[note.CreatedAt.Value.Hour]++;
+                    totalResponses++;
                 }
             }
         }
@@ -317,7 +321,9 @@ public sealed class AdvancedMetricsService : IAdvancedMetricsService
             return new BatchSizeMetric { P50 = null, P95 = null, MrCount = 0 };
         }
 
-        var sorted = commitCounts.OrderBy(x => x).ToList();
+        // Sort once in place and read both percentiles from it
+        commitCounts.Sort();
+        var sorted = commitCounts;
         var p50Index = (int)(sorted.Count * 0.5);
         var p95Index = (int)(sorted.Count * 0.95);
 
@@ -329,14 +335,11 @@ public sealed class AdvancedMetricsService : IAdvancedMetricsService
         };
     }
 
-    private async Task<DraftDurationMetric> CalculateDraftDurationAsync(
-        long userId,
-        List<GitLabMergeRequest> allMergeRequests,
-        IEnumerable<ProjectData> projectDataList,
-        CancellationToken cancellationToken)
+    private DraftDurationMetric CalculateDraftDuration(
+        List<GitLabMergeRequest> userMrs,
+        IReadOnlyDictionary<(long ProjectId, long Iid), IReadOnlyList<GitLabMergeRequestNote>> notesByMergeRequest)
     {
         var draftDurations = new List<double>();
-        var userMrs = allMergeRequests.Where(mr => mr.Author?.Id == userId).ToList();
 
         foreach (var mr in userMrs)
         {
@@ -345,46 +348,51 @@ public sealed class AdvancedMetricsService : IAdvancedMetricsService
                           mr.Title?.StartsWith("Draft:", StringComparison.OrdinalIgnoreCase) == true ||
                           mr.Title?.StartsWith("WIP:", StringComparison.OrdinalIgnoreCase) == true;
 
-            if (!isDraft)
+            // Check system notes for draft state changes
+            if (isDraft || !notesByMergeRequest.TryGetValue((mr.ProjectId, mr.Iid), out var notes))
             {
-                try
+                continue;
+            }
+
+            // Only the first draft and first undraft notes matter, so stop scanning once both are found
+            GitLabMergeRequestNote? draftNote = null;
+            GitLabMergeRequestNote? undraftNote = null;
+
+            foreach (var note in notes)
+            {
+                if (!note.System || note.Body is null)
                 {
-                    // Check system notes for draft state changes
-                    var notes = await _gitLabHttpClient.GetMergeRequestNotesAsync(
-                        mr.ProjectId,
-                        mr.Iid,
-                        cancellationToken);
+                    continue;
+                }
 
-                    var draftNotes = notes
-                        .Where(n => n.System &&
-                                    n.Body is not null &&
-                                    (n.Body.Contains("marked as a **Work In Progress**", StringComparison.OrdinalIgnoreCase) ||
-                                     n.Body.Contains("marked as **draft**", StringComparison.OrdinalIgnoreCase)))
-                        .ToList();
-
-                    var undraftNotes = notes
-                        .Where(n => n.System &&
-                                    n.Body is not null &&
-                                    (n.Body.Contains("unmarked as a **Work In Progress**", StringComparison.OrdinalIgnoreCase) ||
-                                     n.Body.Contains("unmarked as **draft**", StringComparison.OrdinalIgnoreCase)))
-                        .ToList();
-
-                    if (draftNotes.Any() && undraftNotes.Any())
-                    {
-                        var draftStart = draftNotes.First().CreatedAt;
-                        var draftEnd = undraftNotes.First().CreatedAt;
+                var stateChange = DraftStateChangeRegex.Match(note.Body);
+                if (!stateChange.Success)
+                {
+                    continue;
+                }
 
-                        if (draftStart.HasValue && draftEnd.HasValue && draftEnd.Value > draftStart.Value)
-                        {
-                            var duration = (draftEnd.Value - draftStart.Value).TotalHours;
-                            draftDurations.Add(duration);
-                        }
-                    }
+                // "unmarked as ..." also contains "marked as ...", so it counts as a draft marker too
+                draftNote ??= note;
+
+                if (undraftNote is null && stateChange.Groups[1].Success)
+                {
+                    undraftNote = note;
                 }
-                catch (Exception ex)
+
+                if (draftNote is not null && undraftNote is not null)
+                {
+                    break;
+                }
+            }
+
+            if (draftNote is not null && undraftNote is not null)
+            {
+                var draftStart = draftNote.CreatedAt;
+                var draftEnd = undraftNote.CreatedAt;
+
+                if (draftStart.HasValue && draftEnd.HasValue && draftEnd.Value > draftStart.Value)
                 {
-                    _logger.LogDebug(ex, "Failed to fetch draft state for MR {MrIid} in project {ProjectId}",
-                        mr.Iid, mr.ProjectId);
+                    draftDurations.Add((draftEnd.Value - draftStart.Value).TotalHours);
                 }
             }
         }
@@ -394,11 +402,7 @@ public sealed class AdvancedMetricsService : IAdvancedMetricsService
             return new DraftDurationMetric { MedianHours = null, DraftMrCount = 0 };
         }
 
-        var sorted = draftDurations.OrderBy(x => x).ToList();
-        var medianIndex = sorted.Count / 2;
-        var median = sorted.Count % 2 == 0
-            ? (sorted[medianIndex - 1] + sorted[medianIndex]) / 2
-            : sorted[medianIndex];
+        var median = MetricsStatistics.SelectMedian(draftDurations.ToArray());
 
         return new DraftDurationMetric
         {
@@ -407,193 +411,245 @@ public sealed class AdvancedMetricsService : IAdvancedMetricsService
         };
     }
 
-    private async Task<IterationCountMetric> CalculateIterationCountAsync(
-        long userId,
-        List<GitLabMergeRequest> allMergeRequests,
-        IEnumerable<ProjectData> projectDataList,
-        CancellationToken cancellationToken)
+    /// <summary>
+    /// Counts review→commit cycles by walking the two sorted timelines with two pointers instead of
+    /// sorting a combined event list. A review and a commit at the same instant count the review first.
+    /// </summary>
+    private static int CountReviewIterations(List<DateTime> sortedReviewTimes, List<DateTime> sortedCommitTimes)
     {
-        var iterationCounts = new List<int>();
-        var userMrs = allMergeRequests.Where(mr => mr.Author?.Id == userId).ToList();
+        var iterations = 0;
+        var awaitingCommit = false;
+        var reviewIndex = 0;
 
-        foreach (var mr in userMrs)
+        foreach (var commitTime in sortedCommitTimes)
         {
-            try
+            // Consume every review up to this commit
+            while (reviewIndex < sortedReviewTimes.Count && sortedReviewTimes[reviewIndex] <= commitTime)
             {
-                var discussions = await _gitLabHttpClient.GetMergeRequestDiscussionsAsync(
-                    mr.ProjectId,
-                    mr.Iid,
-                    cancellationToken);
+                awaitingCommit = true;
+                reviewIndex++;
+            }
 
-                var commits = await _gitLabHttpClient.GetMergeRequestCommitsAsync(
-                    mr.ProjectId,
-                    mr.Iid,
-                    cancellationToken);
+            if (awaitingCommit)
+            {
+                iterations++;
+                awaitingCommit = false;
+            }
+        }
 
-                // Count review cycles: each cycle is review comments followed by new commits
-                var iterations = 0;
-                var events = new List<(DateTime Time, string Type)>();
+        return iterations;
+    }
 
-                // Add review comments as events
-                foreach (var discussion in discussions)
+    /// <summary>
+    /// Iteration count and idle time in review both read each MR's discussions and commits, so the two timelines
+    /// are collected and sorted once per MR and shared by both metrics
+    /// </summary>
+    private (IterationCountMetric IterationCount, IdleTimeInReviewMetric IdleTimeInReview) CalculateReviewCycleMetrics(
+        long userId,
+        int userMrCount,
+        List<MergeRequestReviewActivity> reviewActivities)
+    {
+        var iterationCounts = new List<int>();
+        var idleTimes = new List<double>();
+
+        foreach (var activity in reviewActivities)
+        {
+            // Comments keep their arrival order so ties between them resolve as before
+            var comments = new List<(DateTime Time, int Order, bool IsFromAuthor)>();
+            var commitTimes = new List<DateTime>();
+
+            // Add review comments and author responses
+            foreach (var discussion in activity.Discussions)
+            {
+                if (discussion.Notes is not null)
                 {
-                    if (discussion.Notes is not null)
+                    foreach (var note in discussion.Notes)
                     {
-                        foreach (var note in discussion.Notes)
+                        if (!note.System && note.CreatedAt.HasValue)
                         {
-                            if (!note.System && note.Author?.Id != userId && note.CreatedAt.HasValue)
-                            {
-                                events.Add((note.CreatedAt.Value, "review"));
-                            }
+                            var isAuthor = note.Author?.Id == userId;
+                            comments.Add((note.CreatedAt.Value, comments.Count, isAuthor));
                         }
                     }
                 }
+            }
 
-                // Add commits as events
-                foreach (var commit in commits)
+            // Add commits
+            foreach (var commit in activity.Commits)
+            {
+                if (commit.CommittedDate.HasValue)
                 {
-                    if (commit.CommittedDate.HasValue)
-                    {
-                        events.Add((commit.CommittedDate.Value, "commit"));
-                    }
+                    commitTimes.Add(commit.CommittedDate.Value);
                 }
+            }
 
-                // Sort by time and count review→commit cycles
-                var sortedEvents = events.OrderBy(e => e.Time).ToList();
-                var lastEventType = "";
-                foreach (var evt in sortedEvents)
-                {
-                    if (evt.Type == "commit" && lastEventType == "review")
-                    {
-                        iterations++;
-                    }
-                    lastEventType = evt.Type;
-                }
+            comments.Sort();
+            commitTimes.Sort();
 
-                if (iterations > 0)
+            // Iterations: each cycle is reviewer comments followed by new commits
+            var reviewTimes = new List<DateTime>(comments.Count);
+            foreach (var comment in comments)
+            {
+                if (!comment.IsFromAuthor)
                 {
-                    iterationCounts.Add(iterations);
+                    reviewTimes.Add(comment.Time);
                 }
             }
-            catch (Exception ex)
+
+            var iterations = CountReviewIterations(reviewTimes, commitTimes);
+            if (iterations > 0)
             {
-                _logger.LogDebug(ex, "Failed to calculate iterations for MR {MrIid} in project {ProjectId}",
-                    mr.Iid, mr.ProjectId);
+                iterationCounts.Add(iterations);
             }
-        }
 
-        if (iterationCounts.Count == 0)
-        {
-            return new IterationCountMetric { Median = null, MrCount = 0 };
+            // Idle time: gaps between reviewer comments and the author's next activity (commit or comment)
+            AddIdleTimesAfterReviews(comments, commitTimes, idleTimes);
         }
 
-        var sorted = iterationCounts.OrderBy(x => x).ToList();
-        var medianIndex = sorted.Count / 2;
-        var median = sorted.Count % 2 == 0
-            ? (sorted[medianIndex - 1] + sorted[medianIndex]) / 2.0m
-            : sorted[medianIndex];
+        var iterationCount = iterationCounts.Count == 0
+            ? new IterationCountMetric { Median = null, MrCount = 0 }
+            : new IterationCountMetric
+            {
+                Median = (decimal)MetricsStatistics.SelectMedian(iterationCounts.Select(count => (double)count).ToArray()),
+                MrCount = iterationCounts.Count
+            };
+
+        var idleTimeInReview = idleTimes.Count == 0
+            ? new IdleTimeInReviewMetric { MedianHours = null, MrCount = 0 }
+            : new IdleTimeInReviewMetric
+            {
+                MedianHours = (decimal)MetricsStatistics.SelectMedian(idleTimes.ToArray()),
+                MrCount = userMrCount
+            };
+
+        return (iterationCount, idleTimeInReview);
+    }
+
+    /// <summary>
+    /// Walks the comments and commits in time order by merging the two sorted lists (comments first on ties), and
+    /// records the gap between each reviewer comment and the author's activity that directly follows it
+    /// </summary>
+    private static void AddIdleTimesAfterReviews(
+        List<(DateTime Time, int Order, bool IsFromAuthor)> sortedComments,
+        List<DateTime> sortedCommitTimes,
+        List<double> idleTimes)
+    {
+        var commentIndex = 0;
+        var commitIndex = 0;
+        DateTime? previousReviewTime = null; // Set while the previous event is a comment not from the author
 
-        return new IterationCountMetric
+        while (commentIndex < sortedComments.Count || commitIndex < sortedCommitTimes.Count)
         {
-            Median = median,
-            MrCount = iterationCounts.Count
-        };
+            DateTime time;
+            bool isComment;
+            bool isFromAuthor;
+
+            if (commitIndex >= sortedCommitTimes.Count ||
+                (commentIndex < sortedComments.Count && sortedComments[commentIndex].Time <= sortedCommitTimes[commitIndex]))
+            {
+                (time, _, isFromAuthor) = sortedComments[commentIndex++];
+                isComment = true;
+            }
+            else
+            {
+                time = sortedCommitTimes[commitIndex++];
+                isComment = false;
+                isFromAuthor = true;
+            }
+
+            // If the previous event is a review comment (not from author) and this is the author's activity
+            if (previousReviewTime.HasValue && isFromAuthor)
+            {
+                var idleTime = (time - previousReviewTime.Value).TotalHours;
+                if (idleTime > 0 && idleTime < 24 * 30) // Cap at 30 days to avoid outliers
+                {
+                    idleTimes.Add(idleTime);
+                }
+            }
+
+            previousReviewTime = isComment && !isFromAuthor ? time : null;
+        }
     }
 
-    private async Task<IdleTimeInReviewMetric> CalculateIdleTimeInReviewAsync(
-        long userId,
-        List<GitLabMergeRequest> allMergeRequests,
+    /// <summary>
+    /// Fetches the notes of every MR in parallel, once, for the metrics that read them
+    /// </summary>
+    private async Task<Dictionary<(long ProjectId, long Iid), IReadOnlyList<GitLabMergeRequestNote>>> FetchMergeRequestNotesAsync(
         IEnumerable<ProjectData> projectDataList,
         CancellationToken cancellationToken)
     {
-        var idleTimes = new List<double>();
-        var userMrs = allMergeRequests.Where(mr => mr.Author?.Id == userId).ToList();
+        var notesTasks = projectDataList
+            .SelectMany(project => project.MergeRequests.Select(mr => (project.ProjectId, MergeRequest: mr)))
+            .Select(async item =>
+            {
+                try
+                {
+                    var notes = await _gitLabHttpClient.GetMergeRequestNotesAsync(
+                        item.ProjectId,
+                        item.MergeRequest.Iid,
+                        cancellationToken);
 
-        foreach (var mr in userMrs)
+                    return (Key: (item.ProjectId, item.MergeRequest.Iid), Notes: notes);
+                }
+                catch (Exception ex)
+                {
+                    _logger.LogDebug(ex, "Failed to fetch notes for MR {MrIid} in project {ProjectId}",
+                        item.MergeRequest.Iid, item.ProjectId);
+                    return (Key: (item.ProjectId, item.MergeRequest.Iid), Notes: (IReadOnlyList<GitLabMergeRequestNote>?)null);
+                }
+            });
+
+        var notesByMergeRequest = new Dictionary<(long ProjectId, long Iid), IReadOnlyList<GitLabMergeRequestNote>>();
+        foreach (var (key, notes) in await Task.WhenAll(notesTasks))
+        {
+            if (notes is not null)
+            {
+                notesByMergeRequest[key] = notes;
+            }
+        }
+
+        return notesByMergeRequest;
+    }
+
+    /// <summary>
+    /// Fetches discussions and commits for each of the user's MRs in parallel, once, for the review metrics
+    /// </summary>
+    private async Task<List<MergeRequestReviewActivity>> FetchReviewActivitiesAsync(
+        List<GitLabMergeRequest> userMrs,
+        CancellationToken cancellationToken)
+    {
+        var activityTasks = userMrs.Select(async mr =>
         {
             try
             {
-                var discussions = await _gitLabHttpClient.GetMergeRequestDiscussionsAsync(
+                var discussionsTask = _gitLabHttpClient.GetMergeRequestDiscussionsAsync(
                     mr.ProjectId,
                     mr.Iid,
                     cancellationToken);
 
-                var commits = await _gitLabHttpClient.GetMergeRequestCommitsAsync(
+                var commitsTask = _gitLabHttpClient.GetMergeRequestCommitsAsync(
                     mr.ProjectId,
                     mr.Iid,
                     cancellationToken);
 
-                // Find gaps between review comments and next activity (commit or comment)
-                var events = new List<(DateTime Time, string Type, bool IsFromAuthor)>();
+                await Task.WhenAll(discussionsTask, commitsTask);
 
-                // Add review comments and author responses
-                foreach (var discussion in discussions)
+                return new MergeRequestReviewActivity
                 {
-                    if (discussion.Notes is not null)
-                    {
-                        foreach (var note in discussion.Notes)
-                        {
-                            if (!note.System && note.CreatedAt.HasValue)
-                            {
-                                var isAuthor = note.Author?.Id == userId;
-                                events.Add((note.CreatedAt.Value, "comment", isAuthor));
-                            }
-                        }
-                    }
-                }
-
-                // Add commits
-                foreach (var commit in commits)
-                {
-                    if (commit.CommittedDate.HasValue)
-                    {
-                        events.Add((commit.CommittedDate.Value, "commit", true));
-                    }
-                }
-
-                // Sort by time
-                var sortedEvents = events.OrderBy(e => e.Time).ToList();
-
-                // Find idle periods after review comments
-                for (var i = 0; i < sortedEvents.Count - 1; i++)
-                {
-                    var current = sortedEvents[i];
-                    var next = sortedEvents[i + 1];
-
-                    // If current is a review comment (not from author) and next is author's activity
-                    if (current.Type == "comment" && !current.IsFromAuthor && next.IsFromAuthor)
-                    {
-                        var idleTime = (next.Time - current.Time).TotalHours;
-                        if (idleTime > 0 && idleTime < 24 * 30) // Cap at 30 days to avoid outliers
-                        {
-                            idleTimes.Add(idleTime);
-                        }
-                    }
-                }
+                    MergeRequest = mr,
+                    Discussions = await discussionsTask,
+                    Commits = await commitsTask
+                };
             }
             catch (Exception ex)
             {
-                _logger.LogDebug(ex, "Failed to calculate idle time for MR {MrIid} in project {ProjectId}",
+                _logger.LogDebug(ex, "Failed to fetch review activity for MR {MrIid} in project {ProjectId}",
                     mr.Iid, mr.ProjectId);
+                return null;
             }
-        }
-
-        if (idleTimes.Count == 0)
-        {
-            return new IdleTimeInReviewMetric { MedianHours = null, MrCount = 0 };
-        }
-
-        var sorted = idleTimes.OrderBy(x => x).ToList();
-        var medianIndex = sorted.Count / 2;
-        var median = sorted.Count % 2 == 0
-            ? (sorted[medianIndex - 1] + sorted[medianIndex]) / 2
-            : sorted[medianIndex];
+        });
 
-        return new IdleTimeInReviewMetric
-        {
-            MedianHours = (decimal)median,
-            MrCount = userMrs.Count
-        };
+        return (await Task.WhenAll(activityTasks)).OfType<MergeRequestReviewActivity>().ToList();
     }
 
     private Task<CrossTeamCollaborationMetric> CalculateCrossTeamCollaborationAsync(
@@ -651,6 +707,13 @@ public sealed class AdvancedMetricsService : IAdvancedMetricsService
         public required List<GitLabCommit> Commits { get; init; }
     }
 
+    private sealed class MergeRequestReviewActivity
+    {
+        public required GitLabMergeRequest MergeRequest { get; init; }
+        public required IReadOnlyList<GitLabDiscussion> Discussions { get; init; }
+        public required IReadOnlyList<GitLabCommit> Commits { get; init; }
+    }
+
     private sealed class BusFactorMetric
     {
         public required decimal GiniCoefficient { get; init; }
@@ -1,5 +1,3 @@
-using System.Text.RegularExpressions;
-
 using Microsoft.Extensions.Options;
 
 using KuriousLabs.Management.KPIAnalysis.ApiService.Configuration;
@@ -48,6 +46,7 @@ public sealed class CodeCharacteristicsService : ICodeCharacteristicsService
 
         var windowEnd = DateTime.UtcNow;
         var windowStart = windowEnd.AddDays(-windowDays);
+        var windowStartOffset = new DateTimeOffset(windowStart, TimeSpan.Zero);
 
         _logger.LogDebug("Fetching data for user {UserId} from {WindowStart} to {WindowEnd}",
             userId, windowStart, windowEnd);
@@ -69,16 +68,21 @@ public sealed class CodeCharacteristicsService : ICodeCharacteristicsService
         {
             try
             {
-                var commits = await _gitLabHttpClient.GetCommitsAsync(
+                // A project's commits and MRs are independent, so request both at once
+                var commitsTask = _gitLabHttpClient.GetCommitsAsync(
                     project.Id,
-                    new DateTimeOffset(windowStart),
+                    windowStartOffset,
                     cancellationToken);
 
-                var mergeRequests = await _gitLabHttpClient.GetMergeRequestsAsync(
+                var mergeRequestsTask = _gitLabHttpClient.GetMergeRequestsAsync(
                     project.Id,
-                    new DateTimeOffset(windowStart),
+                    windowStartOffset,
                     cancellationToken);
 
+                await Task.WhenAll(commitsTask, mergeRequestsTask);
+                var commits = await commitsTask;
+                var mergeRequests = await mergeRequestsTask;
+
                 // Filter commits by author email/name and within time window
                 var userCommits = commits
                     .Where(c => c.AuthorEmail == user.Email || c.AuthorName == user.Name || c.AuthorName == user.Username)
@@ -195,26 +199,18 @@ public sealed class CodeCharacteristicsService : ICodeCharacteristicsService
     private (decimal? Median, decimal? P95, decimal? Average) CalculateCommitSizeMetrics(
         List<GitLabCommit> commits)
     {
-        var commitSizes = commits
+        var commitSizes = MetricsStatistics.ToSortedArray(commits
             .Where(c => c.Stats is not null)
-            .Select(c => c.Stats!.Additions + c.Stats.Deletions)
-            .Where(size => size > 0)
-            .OrderBy(size => size)
-            .ToList();
+            .Select(c => (double)(c.Stats!.Additions + c.Stats.Deletions))
+            .Where(size => size > 0));
 
-        if (!commitSizes.Any())
+        if (commitSizes.Length == 0)
         {
             return (null, null, null);
         }
 
-        var medianIndex = commitSizes.Count / 2;
-        var median = commitSizes.Count % 2 == 0
-            ? (decimal)(commitSizes[medianIndex - 1] + commitSizes[medianIndex]) / 2
-            : (decimal)commitSizes[medianIndex];
-
-        var p95Index = (int)Math.Ceiling(commitSizes.Count * 0.95) - 1;
-        var p95 = (decimal)commitSizes[Math.Min(p95Index, commitSizes.Count - 1)];
-
+        var median = (decimal)MetricsStatistics.Median(commitSizes);
+        var p95 = (decimal)MetricsStatistics.NearestRankPercentile(commitSizes, 0.95);
         var average = (decimal)commitSizes.Average();
 
         return (median, p95, average);
@@ -245,7 +241,8 @@ public sealed class CodeCharacteristicsService : ICodeCharacteristicsService
         var largeCount = 0;
         var extraLargeCount = 0;
 
-        foreach (var mr in mergeRequests)
+        // Fetch every MR's changes in parallel; a failed fetch yields null and is left out of the distribution
+        var linesChangedTasks = mergeRequests.Select(async mr =>
         {
             try
             {
@@ -255,34 +252,38 @@ public sealed class CodeCharacteristicsService : ICodeCharacteristicsService
                     mr.Iid,
                     cancellationToken);
 
-                if (changes is null)
-                {
-                    continue;
-                }
-
-                var linesChanged = changes.Additions + changes.Deletions;
-
-                if (linesChanged < config.SmallMrThreshold)
-                {
-                    smallCount++;
-                }
-                else if (linesChanged < config.MediumMrThreshold)
-                {
-                    mediumCount++;
-                }
-                else if (linesChanged < config.LargeMrThreshold)
-                {
-                    largeCount++;
-                }
-                else
-                {
-                    extraLargeCount++;
-                }
+                return changes is null ? (int?)null : changes.Additions + changes.Deletions;
             }
             catch (Exception ex)
             {
                 _logger.LogWarning(ex, "Failed to get changes for MR {MrIid} in project {ProjectId}",
                     mr.Iid, mr.ProjectId);
+                return null;
+            }
+        });
+
+        foreach (var linesChanged in await Task.WhenAll(linesChangedTasks))
+        {
+            if (linesChanged is null)
+            {
+                continue;
+            }
+
+            if (linesChanged < config.SmallMrThreshold)
+            {
+                smallCount++;
+            }
+            else if (linesChanged < config.MediumMrThreshold)
+            {
+                mediumCount++;
+            }
+            else if (linesChanged < config.LargeMrThreshold)
+            {
+                largeCount++;
+            }
+            else
+            {
+                extraLargeCount++;
             }
         }
 
@@ -365,11 +366,11 @@ public sealed class CodeCharacteristicsService : ICodeCharacteristicsService
 
         // Check for conventional commit format
         var conventionalCommitRegexes = config.ConventionalCommitPatterns
-            .Select(pattern => new Regex(pattern, RegexOptions.IgnoreCase | RegexOptions.Compiled))
+            .Select(ConfiguredPatternRegexCache.Get)
             .ToList();
 
         var excludedPatternRegexes = config.ExcludedCommitMessagePatterns
-            .Select(pattern => new Regex(pattern, RegexOptions.IgnoreCase | RegexOptions.Compiled))
+            .Select(ConfiguredPatternRegexCache.Get)
             .ToList();
 
         var conventionalCount = 0;
@@ -412,7 +413,7 @@ public sealed class CodeCharacteristicsService : ICodeCharacteristicsService
 
         var config = _metricsConfig.CodeCharacteristics;
         var branchPatternRegexes = config.BranchNamingPatterns
-            .Select(pattern => new Regex(pattern, RegexOptions.IgnoreCase | RegexOptions.Compiled))
+            .Select(ConfiguredPatternRegexCache.Get)
             .ToList();
 
         var compliantCount = 0;
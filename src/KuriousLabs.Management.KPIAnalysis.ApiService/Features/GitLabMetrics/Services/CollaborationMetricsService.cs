@@ -1,3 +1,4 @@
+using System.Collections.Concurrent;
 using System.Text.RegularExpressions;
 
 using Microsoft.Extensions.Options;
@@ -17,6 +18,21 @@ public sealed class CollaborationMetricsService : ICollaborationMetricsService
     private readonly ILogger<CollaborationMetricsService> _logger;
     private readonly MetricsConfiguration _configuration;
 
+    // Default bot patterns if none configured
+    private static readonly Regex[] DefaultBotRegexes =
+    [
+        new("bot$", RegexOptions.IgnoreCase | RegexOptions.Compiled),
+        new("^bot-", RegexOptions.IgnoreCase | RegexOptions.Compiled),
+        new("\\[bot\\]", RegexOptions.IgnoreCase | RegexOptions.Compiled),
+        new("-ci$", RegexOptions.IgnoreCase | RegexOptions.Compiled),
+        new("^ci-", RegexOptions.IgnoreCase | RegexOptions.Compiled)
+    ];
+
+    private readonly Regex[] _botRegexes;
+
+    // The same handful of note authors recur across every MR, so classify each username only once
+    private readonly ConcurrentDictionary<string, bool> _botUsernameCache = new(StringComparer.Ordinal);
+
     public CollaborationMetricsService(
         IGitLabHttpClient gitLabHttpClient,
         ILogger<CollaborationMetricsService> logger,
@@ -25,6 +41,14 @@ public sealed class CollaborationMetricsService : ICollaborationMetricsService
         _gitLabHttpClient = gitLabHttpClient;
         _logger = logger;
         _configuration = configuration.Value;
+
+        // Build the bot regexes once instead of re-resolving the pattern strings on every check
+        var botPatterns = _configuration.Identity?.BotRegexPatterns;
+        _botRegexes = botPatterns is null || botPatterns.Count == 0
+            ? DefaultBotRegexes
+            : botPatterns
+                .Select(ConfiguredPatternRegexCache.Get)
+                .ToArray();
     }
 
     public async Task<CollaborationMetricsResult> CalculateCollaborationMetricsAsync(
@@ -48,6 +72,7 @@ public sealed class CollaborationMetricsService : ICollaborationMetricsService
 
         var windowEnd = DateTime.UtcNow;
         var windowStart = windowEnd.AddDays(-windowDays);
+        var windowStartOffset = new DateTimeOffset(windowStart, TimeSpan.Zero);
 
         _logger.LogDebug("Fetching data for user {UserId} from {WindowStart} to {WindowEnd}", 
             userId, windowStart, windowEnd);
@@ -64,37 +89,47 @@ public sealed class CollaborationMetricsService : ICollaborationMetricsService
         _logger.LogInformation("Found {ProjectCount} contributed projects for user {UserId}", 
             contributedProjects.Count, userId);
 
-        // Fetch MRs and notes from all contributed projects in parallel
+        // Fetch MRs from all contributed projects in parallel, starting each MR's enrichment
+        // (notes, discussions, approvals) as soon as it arrives rather than after all listings complete
         var fetchDataTasks = contributedProjects.Select(async project =>
         {
+            var enrichmentTasks = new List<Task<EnrichedMergeRequest>>();
+
             try
             {
-                var mergeRequests = await _gitLabHttpClient.GetMergeRequestsAsync(
-                    project.Id,
-                    new DateTimeOffset(windowStart),
-                    cancellationToken);
+                var mrsInWindow = new List<GitLabMergeRequest>();
 
-                // Filter MRs within time window
-                var mrsInWindow = mergeRequests
-                    .Where(mr => (mr.CreatedAt.HasValue && mr.CreatedAt.Value >= windowStart && mr.CreatedAt.Value <= windowEnd) ||
-                                 (mr.UpdatedAt.HasValue && mr.UpdatedAt.Value >= windowStart && mr.UpdatedAt.Value <= windowEnd))
-                    .ToList();
+                await foreach (var mr in _gitLabHttpClient.StreamMergeRequestsAsync(project.Id, windowStartOffset, cancellationToken))
+                {
+                    // Filter MRs within time window
+                    if ((mr.CreatedAt.HasValue && mr.CreatedAt.Value >= windowStart && mr.CreatedAt.Value <= windowEnd) ||
+                        (mr.UpdatedAt.HasValue && mr.UpdatedAt.Value >= windowStart && mr.UpdatedAt.Value <= windowEnd))
+                    {
+                        mrsInWindow.Add(mr);
+                        enrichmentTasks.Add(EnrichMergeRequestAsync(mr, cancellationToken));
+                    }
+                }
 
                 return new ProjectData
                 {
                     ProjectId = project.Id,
                     ProjectName = project.Name ?? "Unknown",
-                    MergeRequests = mrsInWindow
+                    MergeRequests = mrsInWindow,
+                    EnrichmentTasks = enrichmentTasks
                 };
             }
             catch (Exception ex)
             {
                 _logger.LogWarning(ex, "Failed to fetch data for project {ProjectId}", project.Id);
+
+                // Per-MR tasks already started handle their own failures; let them finish before dropping the project
+                await Task.WhenAll(enrichmentTasks);
                 return new ProjectData
                 {
                     ProjectId = project.Id,
                     ProjectName = project.Name ?? "Unknown",
-                    MergeRequests = []
+                    MergeRequests = [],
+                    EnrichmentTasks = []
                 };
             }
         });
@@ -108,39 +143,7 @@ public sealed class CollaborationMetricsService : ICollaborationMetricsService
             return CreateEmptyResult(user, windowDays, windowStart, windowEnd);
         }
 
-        // Fetch notes, discussions, and approvals for all MRs in parallel
-        var enrichmentTasks = allMergeRequests.Select(async mr =>
-        {
-            try
-            {
-                var notesTask = _gitLabHttpClient.GetMergeRequestNotesAsync(mr.ProjectId, mr.Iid, cancellationToken);
-                var discussionsTask = _gitLabHttpClient.GetMergeRequestDiscussionsAsync(mr.ProjectId, mr.Iid, cancellationToken);
-                var approvalsTask = _gitLabHttpClient.GetMergeRequestApprovalsAsync(mr.ProjectId, mr.Iid, cancellationToken);
-
-                await Task.WhenAll(notesTask, discussionsTask, approvalsTask);
-
-                return new EnrichedMergeRequest
-                {
-                    MergeRequest = mr,
-                    Notes = await notesTask,
-                    Discussions = await discussionsTask,
-                    Approvals = await approvalsTask
-                };
-            }
-            catch (Exception ex)
-            {
-                _logger.LogWarning(ex, "Failed to enrich MR {MrIid} in project {ProjectId}", mr.Iid, mr.ProjectId);
-                return new EnrichedMergeRequest
-                {
-                    MergeRequest = mr,
-                    Notes = Array.Empty<GitLabMergeRequestNote>(),
-                    Discussions = Array.Empty<GitLabDiscussion>(),
-                    Approvals = null
-                };
-            }
-        });
-
-        var enrichedMrs = await Task.WhenAll(enrichmentTasks);
+        var enrichedMrs = await Task.WhenAll(projectDataList.SelectMany(pd => pd.EnrichmentTasks));
 
         // Calculate all metrics
         var metrics = CalculateMetrics(userId, user, enrichedMrs, projectDataList, windowDays, windowStart, windowEnd);
@@ -275,7 +278,9 @@ public sealed class CollaborationMetricsService : ICollaborationMetricsService
         var selfMergedRatio = totalMrsMerged > 0 ? (decimal)selfMergedMrs / totalMrsMerged : (decimal?)null;
 
         // Metric 6: Review Turnaround Time (median)
-        var reviewTurnaroundMedian = ComputeMedian(reviewTurnaroundTimes);
+        var reviewTurnaroundMedian = reviewTurnaroundTimes.Count > 0
+            ? (decimal?)MetricsStatistics.SelectMedian(reviewTurnaroundTimes.ToArray())
+            : null;
 
         // Metric 7: Review Depth Score (average comment length)
         var allReviewComments = otherMrs
@@ -380,34 +385,12 @@ public sealed class CollaborationMetricsService : ICollaborationMetricsService
             return false;
         }
 
-        if (_configuration.Identity?.BotRegexPatterns is null || !_configuration.Identity.BotRegexPatterns.Any())
-        {
-            // Default bot patterns if none configured
-            var defaultPatterns = new[] { "bot$", "^bot-", "\\[bot\\]", "-ci$", "^ci-" };
-            return defaultPatterns.Any(pattern => 
-                Regex.IsMatch(user.Username ?? string.Empty, pattern, RegexOptions.IgnoreCase));
-        }
-
-        return _configuration.Identity.BotRegexPatterns.Any(pattern =>
-            Regex.IsMatch(user.Username ?? string.Empty, pattern, RegexOptions.IgnoreCase));
+        return _botUsernameCache.GetOrAdd(user.Username ?? string.Empty, IsBotUsername);
     }
 
-    private static decimal? ComputeMedian(List<double> values)
+    private bool IsBotUsername(string username)
     {
-        if (!values.Any())
-        {
-            return null;
-        }
-
-        var sorted = values.OrderBy(v => v).ToList();
-        var count = sorted.Count;
-
-        if (count % 2 == 0)
-        {
-            return (decimal)((sorted[count / 2 - 1] + sorted[count / 2]) / 2.0);
-        }
-
-        return (decimal)sorted[count / 2];
+        return _botRegexes.Any(regex => regex.IsMatch(username));
     }
 
     private static CollaborationMetricsResult CreateEmptyResult(
@@ -453,11 +436,46 @@ public sealed class CollaborationMetricsService : ICollaborationMetricsService
         };
     }
 
+    /// <summary>
+    /// Fetches notes, discussions, and approvals for an MR in parallel
+    /// </summary>
+    private async Task<EnrichedMergeRequest> EnrichMergeRequestAsync(GitLabMergeRequest mr, CancellationToken cancellationToken)
+    {
+        try
+        {
+            var notesTask = _gitLabHttpClient.GetMergeRequestNotesAsync(mr.ProjectId, mr.Iid, cancellationToken);
+            var discussionsTask = _gitLabHttpClient.GetMergeRequestDiscussionsAsync(mr.ProjectId, mr.Iid, cancellationToken);
+            var approvalsTask = _gitLabHttpClient.GetMergeRequestApprovalsAsync(mr.ProjectId, mr.Iid, cancellationToken);
+
+            await Task.WhenAll(notesTask, discussionsTask, approvalsTask);
+
+            return new EnrichedMergeRequest
+            {
+                MergeRequest = mr,
+                Notes = await notesTask,
+                Discussions = await discussionsTask,
+                Approvals = await approvalsTask
+            };
+        }
+        catch (Exception ex)
+        {
+            _logger.LogWarning(ex, "Failed to enrich MR {MrIid} in project {ProjectId}", mr.Iid, mr.ProjectId);
+            return new EnrichedMergeRequest
+            {
+                MergeRequest = mr,
+                Notes = Array.Empty<GitLabMergeRequestNote>(),
+                Discussions = Array.Empty<GitLabDiscussion>(),
+                Approvals = null
+            };
+        }
+    }
+
     private sealed class ProjectData
     {
         public required long ProjectId { get; init; }
         public required string ProjectName { get; init; }
         public required List<GitLabMergeRequest> MergeRequests { get; init; }
+        public required List<Task<EnrichedMergeRequest>> EnrichmentTasks { get; init; }
     }
 
     private sealed class EnrichedMergeRequest
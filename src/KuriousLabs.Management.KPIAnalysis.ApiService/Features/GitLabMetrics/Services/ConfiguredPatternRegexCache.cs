@@ -0,0 +1,21 @@
+using System.Collections.Concurrent;
+using System.Text.RegularExpressions;
+
+namespace KuriousLabs.Management.KPIAnalysis.ApiService.Features.GitLabMetrics.Services;
+
+/// <summary>
+/// Process-wide cache of compiled, case-insensitive regexes for configured patterns. The metrics services are
+/// scoped but their configured patterns are not, so each pattern is compiled once per process rather than per request.
+/// </summary>
+internal static class ConfiguredPatternRegexCache
+{
+    private static readonly ConcurrentDictionary<string, Regex> Cache = new(StringComparer.Ordinal);
+
+    /// <summary>
+    /// Returns the compiled regex for the pattern, compiling it on first use
+    /// </summary>
+    internal static Regex Get(string pattern)
+    {
+        return Cache.GetOrAdd(pattern, static p => new Regex(p, RegexOptions.IgnoreCase | RegexOptions.Compiled));
+    }
+}
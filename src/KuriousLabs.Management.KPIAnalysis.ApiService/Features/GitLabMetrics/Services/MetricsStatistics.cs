@@ -0,0 +1,157 @@
+namespace KuriousLabs.Management.KPIAnalysis.ApiService.Features.GitLabMetrics.Services;
+
+/// <summary>
+/// Shared descriptive statistics used by the metrics services
+/// </summary>
+internal static class MetricsStatistics
+{
+    /// <summary>
+    /// Returns the mean, P50 and P95 (nearest-rank) using linear-time selection instead of a full sort.
+    /// </summary>
+    /// <param name="values">Non-empty array of values; reordered in place</param>
+    internal static (double Mean, double P50, double P95) Summarize(double[] values)
+    {
+        var sum = 0.0;
+        foreach (var value in values)
+        {
+            sum += value;
+        }
+
+        var p50Index = NearestRankIndex(values.Length, 0.5);
+        var p95Index = NearestRankIndex(values.Length, 0.95);
+
+        var p50 = SelectInPlace(values, p50Index, 0, values.Length - 1);
+
+        // Everything right of the median is now >= it, so the P95 search only needs that range
+        var p95 = p95Index == p50Index ? p50 : SelectInPlace(values, p95Index, p50Index + 1, values.Length - 1);
+
+        return (sum / values.Length, p50, p95);
+    }
+
+    /// <summary>
+    /// Median (mean of the two middle values for even counts) using linear-time selection instead of a full sort.
+    /// </summary>
+    /// <param name="values">Non-empty array of values; reordered in place</param>
+    internal static double SelectMedian(double[] values)
+    {
+        var middle = values.Length / 2;
+        var upper = SelectInPlace(values, middle, 0, values.Length - 1);
+        if (values.Length % 2 == 1)
+        {
+            return upper;
+        }
+
+        // Everything left of the middle is now <= it, so the lower middle value is the largest of that range
+        var lower = values[0];
+        for (var i = 1; i < middle; i++)
+        {
+            if (values[i] > lower)
+            {
+                lower = values[i];
+            }
+        }
+
+        return (lower + upper) / 2.0;
+    }
+
+    /// <summary>
+    /// Nearest-rank percentile over an already sorted, non-empty array.
+    /// </summary>
+    internal static double NearestRankPercentile(double[] sortedValues, double percentile)
+    {
+        return sortedValues[NearestRankIndex(sortedValues.Length, percentile)];
+    }
+
+    private static int NearestRankIndex(int count, double percentile)
+    {
+        var index = (int)Math.Ceiling(count * percentile) - 1;
+        return Math.Clamp(index, 0, count - 1);
+    }
+
+    /// <summary>
+    /// Quickselect with a three-way partition (so runs of equal values don't degrade it). On return the k-th
+    /// smallest value within [left, right] is at index k, with smaller values before it and larger ones after.
+    /// </summary>
+    private static double SelectInPlace(double[] values, int k, int left, int right)
+    {
+        while (left < right)
+        {
+            var pivot = values[left + ((right - left) / 2)];
+            int lessEnd = left, i = left, greaterStart = right;
+
+            while (i <= greaterStart)
+            {
+                if (values[i] < pivot)
+                {
+                    (values[lessEnd], values[i]) = (values[i], values[lessEnd]);
+                    lessEnd++;
+                    i++;
+                }
+                else if (values[i] > pivot)
+                {
+                    (values[i], values[greaterStart]) = (values[greaterStart], values[i]);
+                    greaterStart--;
+                }
+                else
+                {
+                    i++;
+                }
+            }
+
+            // [left, lessEnd) < pivot, [lessEnd, greaterStart] == pivot, (greaterStart, right] > pivot
+            if (k < lessEnd)
+            {
+                right = lessEnd - 1;
+            }
+            else if (k > greaterStart)
+            {
+                left = greaterStart + 1;
+            }
+            else
+            {
+                return pivot;
+            }
+        }
+
+        return values[k];
+    }
+
+    /// <summary>
+    /// Copies the values into an array and sorts it once so several statistics can be read from it.
+    /// </summary>
+    internal static double[] ToSortedArray(IEnumerable<double> values)
+    {
+        var sorted = values.ToArray();
+        Array.Sort(sorted);
+        return sorted;
+    }
+
+    /// <summary>
+    /// Median over an already sorted, non-empty array (mean of the two middle values for even counts).
+    /// </summary>
+    internal static double Median(double[] sortedValues)
+    {
+        var middle = sortedValues.Length / 2;
+        return sortedValues.Length % 2 == 0
+            ? (sortedValues[middle - 1] + sortedValues[middle]) / 2.0
+            : sortedValues[middle];
+    }
+
+    /// <summary>
+    /// Percentile with linear interpolation between closest ranks over an already sorted, non-empty array.
+    /// </summary>
+    /// <param name="sortedValues">Sorted, non-empty array of values</param>
+    /// <param name="percentile">Percentile in the range [0, 1]</param>
+    internal static double InterpolatedPercentile(double[] sortedValues, double percentile)
+    {
+        var index = percentile * (sortedValues.Length - 1);
+        var lowerIndex = (int)index;
+        if (lowerIndex >= sortedValues.Length - 1)
+        {
+            return sortedValues[^1];
+        }
+
+        var fraction = index - lowerIndex;
+        return sortedValues[lowerIndex] + (fraction * (sortedValues[lowerIndex + 1] - sortedValues[lowerIndex]));
+    }
+}
@@ -44,49 +44,54 @@ public sealed class PipelineMetricsService : IPipelineMetricsService
         _logger.LogDebug("Fetching pipelines for project {ProjectId} from {WindowStart} to {WindowEnd}",
             projectId, windowStart, windowEnd);
 
-        // Get pipelines for the project within the time window
-        var pipelines = await _gitLabHttpClient.GetPipelinesAsync(projectId, new DateTimeOffset(windowStart), cancellationToken);
+        // Fetch every job in the window with one paginated project-level listing (each job carries its
+        // pipeline ID) instead of one jobs request per pipeline, and run it alongside the pipeline listing
+        var jobsTask = FetchProjectJobsAsync(projectId, windowStart, cancellationToken);
 
-        // Filter pipelines within time window
-        var pipelinesInWindow = pipelines
-            .Where(p => p.CreatedAt.HasValue && p.CreatedAt.Value >= windowStart && p.CreatedAt.Value <= windowEnd)
-            .ToList();
+        var pipelinesInWindow = new List<GitLabPipeline>();
+        await foreach (var pipeline in _gitLabHttpClient.StreamPipelinesAsync(projectId, new DateTimeOffset(windowStart), cancellationToken: cancellationToken))
+        {
+            if (pipeline.CreatedAt.HasValue && pipeline.CreatedAt.Value >= windowStart && pipeline.CreatedAt.Value <= windowEnd)
+            {
+                pipelinesInWindow.Add(pipeline);
+            }
+        }
+
+        var projectJobs = await jobsTask;
 
-        if (!pipelinesInWindow.Any())
+        if (pipelinesInWindow.Count == 0)
         {
             _logger.LogWarning("No pipelines found for project {ProjectId} in the specified window", projectId);
             return CreateEmptyResult(project, windowDays, windowStart, windowEnd);
         }
 
-        _logger.LogInformation("Processing {PipelineCount} pipelines for project {ProjectId}", pipelinesInWindow.Count, projectId);
+        // Fold each in-window pipeline's jobs into the per-job-name stats, keeping only the small numeric aggregates.
+        // Jobs of pipelines outside the window are ignored.
+        var pipelinesById = pipelinesInWindow.ToDictionary(p => p.Id);
+        var jobStatsByName = new Dictionary<string, JobNameStats>();
+        var totalJobCount = 0;
 
-        // Fetch jobs for all pipelines (with parallel execution for performance)
-        var jobsFetchTasks = pipelinesInWindow.Select(async pipeline =>
+        foreach (var pipelineJobs in projectJobs.Where(j => pipelinesById.ContainsKey(j.PipelineId)).GroupBy(j => j.PipelineId))
         {
-            try
-            {
-                var jobs = await _gitLabHttpClient.GetPipelineJobsAsync(projectId, pipeline.Id, cancellationToken);
-                return (Pipeline: pipeline, Jobs: jobs);
-            }
-            catch (Exception ex)
-            {
-                _logger.LogWarning(ex, "Failed to fetch jobs for pipeline {PipelineId} in project {ProjectId}", pipeline.Id, projectId);
-                return (Pipeline: pipeline, Jobs: (IReadOnlyList<GitLabPipelineJob>)Array.Empty<GitLabPipelineJob>());
-            }
-        });
+            var jobs = pipelineJobs.ToList();
 
-        var pipelineJobsData = await Task.WhenAll(jobsFetchTasks);
-        var allJobs = pipelineJobsData.SelectMany(pd => pd.Jobs).ToList();
+            // Pipeline timing spans every attempt, but the per-job stats only count the attempt that stands
+            FillTimingFromJobs(pipelinesById[pipelineJobs.Key], jobs);
+            var latestAttempts = SelectLatestAttempts(jobs);
+            AccumulateJobs(jobStatsByName, latestAttempts);
+            totalJobCount += latestAttempts.Count;
+        }
 
-        _logger.LogInformation("Processing {JobCount} jobs across {PipelineCount} pipelines", allJobs.Count, pipelinesInWindow.Count);
+        _logger.LogInformation("Processing {JobCount} jobs across {PipelineCount} pipelines", totalJobCount, pipelinesInWindow.Count);
 
         // Calculate all metrics
-        var failedJobs = CalculateFailedJobRate(allJobs);
+        var mainBranchPipelines = GetMainBranchPipelines(pipelinesInWindow, project.DefaultBranch);
+        var failedJobs = CalculateFailedJobRate(jobStatsByName);
         var retryMetrics = CalculatePipelineRetryRate(pipelinesInWindow);
         var waitTimeMetrics = CalculatePipelineWaitTime(pipelinesInWindow);
-        var deploymentFrequency = CalculateDeploymentFrequency(pipelinesInWindow, project.DefaultBranch);
-        var jobDurationTrends = CalculateJobDurationTrends(allJobs);
-        var branchTypeMetrics = CalculateBranchTypeMetrics(pipelinesInWindow, project.DefaultBranch);
+        var deploymentFrequency = mainBranchPipelines.Count;
+        var jobDurationTrends = CalculateJobDurationTrends(jobStatsByName);
+        var branchTypeMetrics = CalculateBranchTypeMetrics(pipelinesInWindow, mainBranchPipelines);
         var coverageMetrics = CalculateCoverageTrend(pipelinesInWindow);
 
         return new PipelineMetricsResult
@@ -112,31 +117,111 @@ public sealed class PipelineMetricsService : IPipelineMetricsService
         };
     }
 
-    private List<FailedJobSummary> CalculateFailedJobRate(List<GitLabPipelineJob> jobs)
+    private async Task<IReadOnlyList<GitLabPipelineJob>> FetchProjectJobsAsync(long projectId, DateTime windowStart, CancellationToken cancellationToken)
     {
-        if (!jobs.Any())
+        try
         {
-            return new List<FailedJobSummary>();
+            return await _gitLabHttpClient.GetProjectJobsAsync(projectId, new DateTimeOffset(windowStart), cancellationToken);
         }
+        catch (Exception ex) when (ex is not OperationCanceledException)
+        {
+            _logger.LogWarning(ex, "Failed to fetch jobs for project {ProjectId}; job-level metrics and pipeline timing are omitted", projectId);
+            return Array.Empty<GitLabPipelineJob>();
+        }
+    }
 
-        // Group jobs by name and calculate failure rate
-        var jobsByName = jobs
-            .GroupBy(j => j.Name)
-            .Select(g => new
+    /// <summary>
+    /// The pipelines list endpoint usually omits started_at/finished_at/duration. Rather than fetching every
+    /// pipeline individually, derive them from the jobs that are fetched anyway (earliest job start, latest finish).
+    /// </summary>
+    private static void FillTimingFromJobs(GitLabPipeline pipeline, List<GitLabPipelineJob> jobs)
+    {
+        DateTime? earliestStart = null;
+        DateTime? latestFinish = null;
+        foreach (var job in jobs)
+        {
+            if (job.StartedAt.HasValue && (earliestStart is null || job.StartedAt.Value < earliestStart.Value))
             {
-                JobName = g.Key,
-                TotalRuns = g.Count(),
-                FailureCount = g.Count(j => j.Status.Equals("failed", StringComparison.OrdinalIgnoreCase) && !j.AllowFailure)
-            })
-            .Where(j => j.FailureCount > 0) // Only include jobs that have failed
-            .OrderByDescending(j => j.FailureCount)
+                earliestStart = job.StartedAt;
+            }
+
+            if (job.FinishedAt.HasValue && (latestFinish is null || job.FinishedAt.Value > latestFinish.Value))
+            {
+                latestFinish = job.FinishedAt;
+            }
+        }
+
+        pipeline.StartedAt ??= earliestStart;
+        pipeline.FinishedAt ??= latestFinish;
+
+        if (pipeline.Duration is null && pipeline.StartedAt.HasValue && pipeline.FinishedAt.HasValue)
+        {
+            pipeline.Duration = (int)(pipeline.FinishedAt.Value - pipeline.StartedAt.Value).TotalSeconds;
+        }
+    }
+
+    /// <summary>
+    /// The project jobs listing returns every attempt of a retried job (the per-pipeline listing hides them by
+    /// default), so keep only the latest attempt, i.e. the highest job ID, per job name within a pipeline
+    /// </summary>
+    private static List<GitLabPipelineJob> SelectLatestAttempts(List<GitLabPipelineJob> pipelineJobs)
+    {
+        var latestByName = new Dictionary<string, GitLabPipelineJob>();
+        foreach (var job in pipelineJobs)
+        {
+            if (!latestByName.TryGetValue(job.Name, out var latest) || job.Id > latest.Id)
+            {
+                latestByName[job.Name] = job;
+            }
+        }
+
+        return latestByName.Count == pipelineJobs.Count ? pipelineJobs : latestByName.Values.ToList();
+    }
+
+    private static void AccumulateJobs(Dictionary<string, JobNameStats> statsByName, List<GitLabPipelineJob> jobs)
+    {
+        // Single pass over a pipeline's jobs collecting everything the per-job-name metrics need
+        foreach (var job in jobs)
+        {
+            if (!statsByName.TryGetValue(job.Name, out var stats))
+            {
+                stats = new JobNameStats();
+                statsByName[job.Name] = stats;
+            }
+
+            stats.TotalRuns++;
+
+            if (!job.AllowFailure && job.Status.Equals("failed", StringComparison.OrdinalIgnoreCase))
+            {
+                stats.FailureCount++;
+            }
+
+            if (job.Duration is > 0)
+            {
+                stats.TimedRuns.Add((job.CreatedAt, job.Duration.Value));
+            }
+        }
+    }
+
+    private List<FailedJobSummary> CalculateFailedJobRate(Dictionary<string, JobNameStats> jobStatsByName)
+    {
+        if (jobStatsByName.Count == 0)
+        {
+            return new List<FailedJobSummary>();
+        }
+
+        // Calculate failure rate per job name
+        var jobsByName = jobStatsByName
+            .Where(kvp => kvp.Value.FailureCount > 0) // Only include jobs that have failed
+            .OrderByDescending(kvp => kvp.Value.FailureCount)
+            .ThenBy(kvp => kvp.Key, StringComparer.Ordinal) // Keep ties stable
             .Take(10) // Top 10 most failing jobs
-            .Select(j => new FailedJobSummary
+            .Select(kvp => new FailedJobSummary
             {
-                JobName = j.JobName,
-                FailureCount = j.FailureCount,
-                TotalRuns = j.TotalRuns,
-                FailureRate = j.TotalRuns > 0 ? (decimal)j.FailureCount / j.TotalRuns : 0
+                JobName = kvp.Key,
+                FailureCount = kvp.Value.FailureCount,
+                TotalRuns = kvp.Value.TotalRuns,
+                FailureRate = kvp.Value.TotalRuns > 0 ? (decimal)kvp.Value.FailureCount / kvp.Value.TotalRuns : 0
             })
             .ToList();
 
@@ -150,19 +235,24 @@ public sealed class PipelineMetricsService : IPipelineMetricsService
             return (null, 0);
         }
 
-        // Group pipelines by SHA to identify retries
-        var pipelinesBySha = pipelines
-            .GroupBy(p => p.Sha)
-            .Select(g => new
+        // Count pipelines per SHA in one pass to identify retries
+        var pipelineCountBySha = new Dictionary<string, int>();
+        foreach (var pipeline in pipelines)
+        {
+            var sha = pipeline.Sha ?? string.Empty;
+            pipelineCountBySha[sha] = pipelineCountBySha.GetValueOrDefault(sha) + 1;
+        }
+
+        var retriedCount = 0;
+        foreach (var count in pipelineCountBySha.Values)
+        {
+            if (count > 1)
             {
-                Sha = g.Key,
-                PipelineCount = g.Count(),
-                IsRetried = g.Count() > 1
-            })
-            .ToList();
+                retriedCount++;
+            }
+        }
 
-        var retriedCount = pipelinesBySha.Count(p => p.IsRetried);
-        var retryRate = (decimal)retriedCount / pipelinesBySha.Count;
+        var retryRate = (decimal)retriedCount / pipelineCountBySha.Count;
 
         return (retryRate, retriedCount);
     }
@@ -173,66 +263,76 @@ public sealed class PipelineMetricsService : IPipelineMetricsService
             .Where(p => p.CreatedAt.HasValue && p.StartedAt.HasValue)
             .Select(p => (p.StartedAt!.Value - p.CreatedAt!.Value).TotalSeconds)
             .Where(d => d > 0)
-            .OrderBy(d => d)
-            .ToList();
+            .ToArray();
 
-        if (!waitTimesInSeconds.Any())
+        if (waitTimesInSeconds.Length == 0)
         {
             return (null, null, 0);
         }
 
-        var p50Index = (int)Math.Ceiling(waitTimesInSeconds.Count * 0.5) - 1;
-        var p95Index = (int)Math.Ceiling(waitTimesInSeconds.Count * 0.95) - 1;
+        var (_, p50Seconds, p95Seconds) = MetricsStatistics.Summarize(waitTimesInSeconds);
 
-        var p50Minutes = (decimal)(waitTimesInSeconds[p50Index] / 60.0);
-        var p95Minutes = (decimal)(waitTimesInSeconds[p95Index] / 60.0);
+        var p50Minutes = (decimal)(p50Seconds / 60.0);
+        var p95Minutes = (decimal)(p95Seconds / 60.0);
 
-        return (p50Minutes, p95Minutes, waitTimesInSeconds.Count);
+        return (p50Minutes, p95Minutes, waitTimesInSeconds.Length);
     }
 
-    private int CalculateDeploymentFrequency(List<GitLabPipeline> pipelines, string? defaultBranch)
+    private static HashSet<GitLabPipeline> GetMainBranchPipelines(List<GitLabPipeline> pipelines, string? defaultBranch)
     {
         if (string.IsNullOrEmpty(defaultBranch))
         {
             defaultBranch = "main";
         }
 
-        // Count pipelines on main/master/production branches
-        var deploymentPipelines = pipelines.Count(p =>
-            p.Ref?.Equals(defaultBranch, StringComparison.OrdinalIgnoreCase) == true ||
-            p.Ref?.Equals("main", StringComparison.OrdinalIgnoreCase) == true ||
-            p.Ref?.Equals("master", StringComparison.OrdinalIgnoreCase) == true ||
-            p.Ref?.Equals("production", StringComparison.OrdinalIgnoreCase) == true);
+        // Classify every pipeline's ref once; deployment frequency and branch type metrics share the result
+        var mainBranchRefs = new HashSet<string>(StringComparer.OrdinalIgnoreCase) { defaultBranch, "main", "master", "production" };
 
-        return deploymentPipelines;
+        return pipelines
+            .Where(p => p.Ref is not null && mainBranchRefs.Contains(p.Ref))
+            .ToHashSet();
     }
 
-    private List<JobDurationTrend> CalculateJobDurationTrends(List<GitLabPipelineJob> jobs)
+    private List<JobDurationTrend> CalculateJobDurationTrends(Dictionary<string, JobNameStats> jobStatsByName)
     {
-        if (!jobs.Any())
+        if (jobStatsByName.Count == 0)
         {
             return new List<JobDurationTrend>();
         }
 
-        // Group jobs by name and calculate duration statistics
-        var jobTrends = jobs
-            .Where(j => j.Duration.HasValue && j.Duration.Value > 0)
-            .GroupBy(j => j.Name)
-            .Where(g => g.Count() >= 3) // Need at least 3 runs to determine trend
-            .Select(g =>
+        // Calculate duration statistics per job name
+        var jobTrends = jobStatsByName
+            .Where(kvp => kvp.Value.TimedRuns.Count >= 3) // Need at least 3 runs to determine trend
+            .Select(kvp =>
             {
-                var orderedJobs = g.OrderBy(j => j.CreatedAt).ToList();
-                var durations = orderedJobs.Select(j => j.Duration!.Value).ToList();
-                var durationsInMinutes = durations.Select(d => (decimal)(d / 60.0)).OrderBy(d => d).ToList();
-
-                var p50Index = (int)Math.Ceiling(durationsInMinutes.Count * 0.5) - 1;
-                var p95Index = (int)Math.Ceiling(durationsInMinutes.Count * 0.95) - 1;
+                // Project the runs into a chronological array of durations once, then work on that array
+                var durations = kvp.Value.TimedRuns
+                    .OrderBy(run => run.CreatedAt)
+                    .Select(run => run.DurationSeconds)
+                    .ToArray();
 
                 // Calculate trend: compare first half vs second half
-                var midpoint = orderedJobs.Count / 2;
-                var firstHalfAvg = orderedJobs.Take(midpoint).Average(j => j.Duration!.Value);
-                var secondHalfAvg = orderedJobs.Skip(midpoint).Average(j => j.Duration!.Value);
-                
+                var midpoint = durations.Length / 2;
+                var firstHalfSum = 0.0;
+                var secondHalfSum = 0.0;
+                for (var i = 0; i < durations.Length; i++)
+                {
+                    if (i < midpoint)
+                    {
+                        firstHalfSum += durations[i];
+                    }
+                    else
+                    {
+                        secondHalfSum += durations[i];
+                    }
+                }
+
+                var firstHalfAvg = firstHalfSum / midpoint;
+                var secondHalfAvg = secondHalfSum / (durations.Length - midpoint);
+
+                // Summarize reorders in place, so it runs after the chronological pass
+                var (meanSeconds, p50Seconds, p95Seconds) = MetricsStatistics.Summarize(durations);
+
                 var trend = "stable";
                 var changePercent = Math.Abs((secondHalfAvg - firstHalfAvg) / firstHalfAvg);
                 
@@ -243,12 +343,12 @@ public sealed class PipelineMetricsService : IPipelineMetricsService
 
                 return new JobDurationTrend
                 {
-                    JobName = g.Key,
-                    AverageDurationMin = (decimal)(durations.Average() / 60.0),
-                    DurationP50Min = durationsInMinutes[p50Index],
-                    DurationP95Min = durationsInMinutes[p95Index],
+                    JobName = kvp.Key,
+                    AverageDurationMin = (decimal)(meanSeconds / 60.0),
+                    DurationP50Min = (decimal)(p50Seconds / 60.0),
+                    DurationP95Min = (decimal)(p95Seconds / 60.0),
                     Trend = trend,
-                    RunCount = g.Count()
+                    RunCount = durations.Length
                 };
             })
             .OrderByDescending(t => t.AverageDurationMin)
@@ -258,66 +358,76 @@ public sealed class PipelineMetricsService : IPipelineMetricsService
         return jobTrends;
     }
 
-    private BranchTypeMetrics CalculateBranchTypeMetrics(List<GitLabPipeline> pipelines, string? defaultBranch)
+    private BranchTypeMetrics CalculateBranchTypeMetrics(List<GitLabPipeline> pipelines, HashSet<GitLabPipeline> mainBranchPipelines)
     {
-        if (string.IsNullOrEmpty(defaultBranch))
+        // Tally totals and successes per branch type in a single pass
+        int mainBranchTotalCount = 0, mainBranchSuccessCount = 0, featureBranchTotalCount = 0, featureBranchSuccessCount = 0;
+        foreach (var pipeline in pipelines)
         {
-            defaultBranch = "main";
+            var isSuccess = pipeline.Status?.Equals("success", StringComparison.OrdinalIgnoreCase) == true;
+            if (mainBranchPipelines.Contains(pipeline))
+            {
+                mainBranchTotalCount++;
+                mainBranchSuccessCount += isSuccess ? 1 : 0;
+            }
+            else
+            {
+                featureBranchTotalCount++;
+                featureBranchSuccessCount += isSuccess ? 1 : 0;
+            }
         }
 
-        // Separate pipelines by branch type
-        var mainBranchPipelines = pipelines
-            .Where(p =>
-                p.Ref?.Equals(defaultBranch, StringComparison.OrdinalIgnoreCase) == true ||
-                p.Ref?.Equals("main", StringComparison.OrdinalIgnoreCase) == true ||
-                p.Ref?.Equals("master", StringComparison.OrdinalIgnoreCase) == true ||
-                p.Ref?.Equals("production", StringComparison.OrdinalIgnoreCase) == true)
-            .ToList();
-
-        var featureBranchPipelines = pipelines.Except(mainBranchPipelines).ToList();
-
-        var mainBranchSuccessCount = mainBranchPipelines.Count(p => p.Status?.Equals("success", StringComparison.OrdinalIgnoreCase) == true);
-        var featureBranchSuccessCount = featureBranchPipelines.Count(p => p.Status?.Equals("success", StringComparison.OrdinalIgnoreCase) == true);
-
         return new BranchTypeMetrics
         {
-            MainBranchSuccessRate = mainBranchPipelines.Any() ? (decimal)mainBranchSuccessCount / mainBranchPipelines.Count : null,
+            MainBranchSuccessRate = mainBranchTotalCount > 0 ? (decimal)mainBranchSuccessCount / mainBranchTotalCount : null,
             MainBranchSuccessCount = mainBranchSuccessCount,
-            MainBranchTotalCount = mainBranchPipelines.Count,
-            FeatureBranchSuccessRate = featureBranchPipelines.Any() ? (decimal)featureBranchSuccessCount / featureBranchPipelines.Count : null,
+            MainBranchTotalCount = mainBranchTotalCount,
+            FeatureBranchSuccessRate = featureBranchTotalCount > 0 ? (decimal)featureBranchSuccessCount / featureBranchTotalCount : null,
             FeatureBranchSuccessCount = featureBranchSuccessCount,
-            FeatureBranchTotalCount = featureBranchPipelines.Count
+            FeatureBranchTotalCount = featureBranchTotalCount
         };
     }
 
     private (decimal? AverageCoverage, string? Trend, int Count) CalculateCoverageTrend(List<GitLabPipeline> pipelines)
     {
-        // Filter pipelines with coverage data
-        var pipelinesWithCoverage = pipelines
+        // Project pipelines with coverage data into a chronological array of values once
+        var coverageValues = pipelines
             .Where(p => !string.IsNullOrEmpty(p.Coverage))
-            .Select(p => new
-            {
-                Pipeline = p,
-                CoverageValue = TryParseCoverage(p.Coverage)
-            })
+            .Select(p => (p.CreatedAt, CoverageValue: TryParseCoverage(p.Coverage)))
             .Where(p => p.CoverageValue.HasValue)
-            .OrderBy(p => p.Pipeline.CreatedAt)
-            .ToList();
+            .OrderBy(p => p.CreatedAt)
+            .Select(p => p.CoverageValue!.Value)
+            .ToArray();
 
-        if (!pipelinesWithCoverage.Any())
+        if (coverageValues.Length == 0)
         {
             return (null, null, 0);
         }
 
-        var averageCoverage = (decimal)pipelinesWithCoverage.Average(p => p.CoverageValue!.Value);
+        // Overall and half sums in a single pass
+        var midpoint = coverageValues.Length / 2;
+        var firstHalfSum = 0.0;
+        var secondHalfSum = 0.0;
+        for (var i = 0; i < coverageValues.Length; i++)
+        {
+            if (i < midpoint)
+            {
+                firstHalfSum += coverageValues[i];
+            }
+            else
+            {
+                secondHalfSum += coverageValues[i];
+            }
+        }
+
+        var averageCoverage = (decimal)((firstHalfSum + secondHalfSum) / coverageValues.Length);
 
         // Calculate trend: compare first half vs second half
         string? trend = null;
-        if (pipelinesWithCoverage.Count >= 4)
+        if (coverageValues.Length >= 4)
         {
-            var midpoint = pipelinesWithCoverage.Count / 2;
-            var firstHalfAvg = pipelinesWithCoverage.Take(midpoint).Average(p => p.CoverageValue!.Value);
-            var secondHalfAvg = pipelinesWithCoverage.Skip(midpoint).Average(p => p.CoverageValue!.Value);
+            var firstHalfAvg = firstHalfSum / midpoint;
+            var secondHalfAvg = secondHalfSum / (coverageValues.Length - midpoint);
 
             var changePercent = Math.Abs(secondHalfAvg - firstHalfAvg);
             
@@ -331,7 +441,7 @@ public sealed class PipelineMetricsService : IPipelineMetricsService
             }
         }
 
-        return (averageCoverage, trend, pipelinesWithCoverage.Count);
+        return (averageCoverage, trend, coverageValues.Length);
     }
 
     private double? TryParseCoverage(string? coverage)
@@ -385,4 +495,11 @@ public sealed class PipelineMetricsService : IPipelineMetricsService
             PipelinesWithCoverageCount = 0
         };
     }
+
+    private sealed class JobNameStats
+    {
+        public int TotalRuns { get; set; }
+        public int FailureCount { get; set; }
+        public List<(DateTime CreatedAt, double DurationSeconds)> TimedRuns { get; } = [];
+    }
 }
@@ -32,8 +32,17 @@ public sealed class ProjectMetricsService(
             throw new InvalidOperationException($"Project {projectId} not found");
         }
 
+        // Commits, MRs, branches and milestones are independent, so fetch them concurrently
+        var windowStartOffset = new DateTimeOffset(windowStart, TimeSpan.Zero);
+        var commitsTask = _gitLabHttpClient.GetCommitsAsync(projectId, windowStartOffset, cancellationToken);
+        var mergeRequestsTask = _gitLabHttpClient.GetMergeRequestsAsync(projectId, windowStartOffset, cancellationToken);
+        var branchesTask = _gitLabHttpClient.GetBranchesAsync(projectId, cancellationToken);
+        var milestonesTask = _gitLabHttpClient.GetMilestonesAsync(projectId, cancellationToken);
+
+        await Task.WhenAll(commitsTask, mergeRequestsTask, branchesTask, milestonesTask);
+
         // Get commits in the window
-        var commits = await _gitLabHttpClient.GetCommitsAsync(projectId, new DateTimeOffset(windowStart, TimeSpan.Zero), cancellationToken);
+        var commits = await commitsTask;
         var commitsInWindow = commits
             .Where(c => c.CommittedDate.HasValue &&
                        c.CommittedDate.Value >= windowStart &&
@@ -41,7 +50,7 @@ public sealed class ProjectMetricsService(
             .ToList();
 
         // Get MRs in the window
-        var allMrs = await _gitLabHttpClient.GetMergeRequestsAsync(projectId, new DateTimeOffset(windowStart, TimeSpan.Zero), cancellationToken);
+        var allMrs = await mergeRequestsTask;
         var mergedMrs = allMrs
             .Where(mr => mr.State == "merged" &&
                        mr.MergedAt.HasValue &&
@@ -69,18 +78,16 @@ public sealed class ProjectMetricsService(
         var uniqueContributors = mrAuthors.Count;
 
         // Calculate cross-project contributors (contributors who also work on other projects)
-        var crossProjectContributors = 0;
-        foreach (var authorId in mrAuthors)
+        var authorProjectCountTasks = mrAuthors.Select(async authorId =>
         {
             var userProjects = await _gitLabHttpClient.GetUserContributedProjectsAsync(authorId, cancellationToken);
-            if (userProjects.Count > 1)
-            {
-                crossProjectContributors++;
-            }
-        }
+            return userProjects.Count;
+        });
+
+        var crossProjectContributors = (await Task.WhenAll(authorProjectCountTasks)).Count(count => count > 1);
 
         // Get branches and calculate long-lived branches
-        var branches = await _gitLabHttpClient.GetBranchesAsync(projectId, cancellationToken);
+        var branches = await branchesTask;
         var longLivedBranches = branches
             .Where(b => !b.Merged &&
                        (windowEnd - b.Commit.CommittedDate.DateTime).TotalDays > LongLivedBranchThresholdDays)
@@ -116,7 +123,7 @@ public sealed class ProjectMetricsService(
         }
 
         // Get milestones and calculate completion rate
-        var milestones = await _gitLabHttpClient.GetMilestonesAsync(projectId, cancellationToken);
+        var milestones = await milestonesTask;
         var completedMilestones = milestones.Where(m => m.State == "closed").ToList();
         var onTimeMilestones = completedMilestones
             .Where(m => m.DueDate.HasValue &&
@@ -127,13 +134,24 @@ public sealed class ProjectMetricsService(
             ? (decimal?)((decimal)onTimeMilestones.Count / completedMilestones.Count * 100)
             : null;
 
+        // Fetch approvals and changes for every merged MR at once; the client's shared limiter bounds in-flight requests
+        var mergedMrDetails = await Task.WhenAll(mergedMrs.Select(async mr =>
+        {
+            var approvalsTask = _gitLabHttpClient.GetMergeRequestApprovalsAsync(projectId, mr.Iid, cancellationToken);
+            var changesTask = _gitLabHttpClient.GetMergeRequestChangesAsync(projectId, mr.Iid, cancellationToken);
+            await Task.WhenAll(approvalsTask, changesTask);
+            return (Approvals: await approvalsTask, Changes: await changesTask);
+        }));
+
         // Calculate review coverage
         const int minReviewersRequired = 1;
         var mrsWithSufficientReviewers = 0;
 
-        foreach (var mr in mergedMrs)
+        // Calculate total lines changed from each merged MR's changes
+        var totalLinesChanged = 0;
+
+        foreach (var (approvals, changes) in mergedMrDetails)
         {
-            var approvals = await _gitLabHttpClient.GetMergeRequestApprovalsAsync(projectId, mr.Iid, cancellationToken);
             if (approvals is not null)
             {
                 var reviewerCount = approvals.ApprovedBy?.Count ?? 0;
@@ -142,23 +160,17 @@ public sealed class ProjectMetricsService(
                     mrsWithSufficientReviewers++;
                 }
             }
-        }
 
-        var reviewCoveragePercentage = mergedMrs.Any()
-            ? (decimal?)((decimal)mrsWithSufficientReviewers / mergedMrs.Count * 100)
-            : null;
-
-        // Calculate total lines changed by fetching MR changes for each merged MR
-        var totalLinesChanged = 0;
-        foreach (var mr in mergedMrs)
-        {
-            var changes = await _gitLabHttpClient.GetMergeRequestChangesAsync(projectId, mr.Iid, cancellationToken);
             if (changes is not null)
             {
                 totalLinesChanged += changes.Total;
             }
         }
 
+        var reviewCoveragePercentage = mergedMrs.Any()
+            ? (decimal?)((decimal)mrsWithSufficientReviewers / mergedMrs.Count * 100)
+            : null;
+
         _logger.LogInformation(
             "Project metrics calculated for {ProjectId}: {Commits} commits, {MergedMrs} merged MRs, {LongLivedBranches} long-lived branches, {LinesChanged} lines changed",
             projectId, commitsInWindow.Count, mergedMrs.Count, longLivedBranches.Count, totalLinesChanged);
@@ -46,6 +46,7 @@ public sealed class QualityMetricsService : IQualityMetricsService
 
         var windowEnd = DateTime.UtcNow;
         var windowStart = windowEnd.AddDays(-windowDays);
+        var windowStartOffset = new DateTimeOffset(windowStart, TimeSpan.Zero);
 
         _logger.LogDebug("Fetching data for user {UserId} from {WindowStart} to {WindowEnd}",
             userId, windowStart, windowEnd);
@@ -67,15 +68,25 @@ public sealed class QualityMetricsService : IQualityMetricsService
         {
             try
             {
-                var mergeRequests = await _gitLabHttpClient.GetMergeRequestsAsync(
+                // A project's MRs and pipelines are independent, so request both at once
+                var mergeRequestsTask = _gitLabHttpClient.GetMergeRequestsAsync(
                     project.Id,
-                    new DateTimeOffset(windowStart),
+                    windowStartOffset,
                     cancellationToken);
 
-                var pipelines = await _gitLabHttpClient.GetPipelinesAsync(
-                    project.Id,
-                    new DateTimeOffset(windowStart),
-                    cancellationToken);
+                // Only the user's own pipelines are needed. The list payload carries no user, so the username
+                // filter applied by GitLab is the only way to select them; without a username there are none to attribute.
+                var pipelinesTask = string.IsNullOrEmpty(user.Username)
+                    ? Task.FromResult<IReadOnlyList<GitLabPipeline>>([])
+                    : _gitLabHttpClient.GetPipelinesAsync(
+                        project.Id,
+                        windowStartOffset,
+                        user.Username,
+                        cancellationToken);
+
+                await Task.WhenAll(mergeRequestsTask, pipelinesTask);
+                var mergeRequests = await mergeRequestsTask;
+                var pipelines = await pipelinesTask;
 
                 // Filter MRs by author and within time window
                 var userMergeRequests = mergeRequests
@@ -83,9 +94,8 @@ public sealed class QualityMetricsService : IQualityMetricsService
                     .Where(mr => mr.MergedAt.HasValue && mr.MergedAt.Value >= windowStart && mr.MergedAt.Value <= windowEnd)
                     .ToList();
 
-                // Filter pipelines by author
+                // Pipelines are already narrowed to the user server-side; keep those created within the window
                 var userPipelines = pipelines
-                    .Where(p => p.User?.Id == userId)
                     .Where(p => p.CreatedAt.HasValue && p.CreatedAt.Value >= windowStart && p.CreatedAt.Value <= windowEnd)
                     .ToList();
 
@@ -179,57 +189,54 @@ public sealed class QualityMetricsService : IQualityMetricsService
             return (0, 0);
         }
 
-        var reworkCount = 0;
-
-        // For each MR, check if there were commits after first review
-        foreach (var mr in mergeRequests)
+        // For each MR, check if there were commits after first review; MRs are independent, so check them in parallel
+        var reworkTasks = mergeRequests.Select(async mr =>
         {
             try
             {
-                // Get commits for the MR
-                var commits = await _gitLabHttpClient.GetMergeRequestCommitsAsync(
+                // Get commits for the MR, and notes to find the first review timestamp, at the same time
+                var commitsTask = _gitLabHttpClient.GetMergeRequestCommitsAsync(
                     mr.ProjectId,
                     mr.Iid,
                     cancellationToken);
 
-                if (!commits.Any())
-                {
-                    continue;
-                }
-
-                // Get notes/discussions to find first review timestamp
-                var notes = await _gitLabHttpClient.GetMergeRequestNotesAsync(
+                var notesTask = _gitLabHttpClient.GetMergeRequestNotesAsync(
                     mr.ProjectId,
                     mr.Iid,
                     cancellationToken);
 
-                // First review is first non-author comment
-                var firstReview = notes
-                    .Where(n => n.Author?.Id != mr.Author?.Id)
-                    .OrderBy(n => n.CreatedAt)
-                    .FirstOrDefault();
+                await Task.WhenAll(commitsTask, notesTask);
+                var commits = await commitsTask;
 
-                if (firstReview is not null)
+                if (!commits.Any())
                 {
-                    var firstReviewTime = firstReview.CreatedAt;
+                    return false;
+                }
 
-                    // Check if any commits came after first review
-                    var commitsAfterReview = commits
-                        .Where(c => c.CommittedDate.HasValue && c.CommittedDate.Value > firstReviewTime)
-                        .ToList();
+                var notes = await notesTask;
 
-                    if (commitsAfterReview.Any())
-                    {
-                        reworkCount++;
-                    }
+                // First review is first non-author comment; notes arrive oldest first
+                var firstReview = notes.FirstOrDefault(n => n.Author?.Id != mr.Author?.Id);
+
+                if (firstReview is null)
+                {
+                    return false;
                 }
+
+                var firstReviewTime = firstReview.CreatedAt;
+
+                // Check if any commits came after first review
+                return commits.Any(c => c.CommittedDate.HasValue && c.CommittedDate.Value > firstReviewTime);
             }
             catch (Exception ex)
             {
                 _logger.LogWarning(ex, "Failed to check rework for MR {MrIid} in project {ProjectId}",
                     mr.Iid, mr.ProjectId);
+                return false;
             }
-        }
+        });
+
+        var reworkCount = (await Task.WhenAll(reworkTasks)).Count(hadRework => hadRework);
 
         var ratio = (decimal)reworkCount / mergeRequests.Count;
         return (ratio, reworkCount);
@@ -282,21 +289,19 @@ public sealed class QualityMetricsService : IQualityMetricsService
             .Where(p => p.UpdatedAt.HasValue && p.CreatedAt.HasValue)
             .Select(p => (p.UpdatedAt!.Value - p.CreatedAt!.Value).TotalSeconds)
             .Where(d => d > 0)
-            .OrderBy(d => d)
-            .ToList();
+            .ToArray();
 
-        if (!durationsInSeconds.Any())
+        if (durationsInSeconds.Length == 0)
         {
             return (null, null, 0);
         }
 
-        var p50Index = (int)Math.Ceiling(durationsInSeconds.Count * 0.5) - 1;
-        var p95Index = (int)Math.Ceiling(durationsInSeconds.Count * 0.95) - 1;
+        var (_, p50Seconds, p95Seconds) = MetricsStatistics.Summarize(durationsInSeconds);
 
-        var p50Minutes = (decimal)(durationsInSeconds[p50Index] / 60.0);
-        var p95Minutes = (decimal)(durationsInSeconds[p95Index] / 60.0);
+        var p50Minutes = (decimal)(p50Seconds / 60.0);
+        var p95Minutes = (decimal)(p95Seconds / 60.0);
 
-        return (p50Minutes, p95Minutes, durationsInSeconds.Count);
+        return (p50Minutes, p95Minutes, durationsInSeconds.Length);
     }
 
     private (decimal? AverageCoverage, int Count) CalculateCoverageMetrics(
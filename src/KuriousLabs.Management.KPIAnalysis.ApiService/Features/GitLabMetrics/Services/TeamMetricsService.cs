@@ -46,119 +46,135 @@ public sealed class TeamMetricsService(
         var allProjects = await _gitLabHttpClient.GetProjectsAsync(cancellationToken);
         var projectDict = allProjects.ToDictionary(p => (long)p.Id, p => p);
 
-        // Aggregate data across all team members
-        var allMergedMrs = new List<GitLabMergeRequest>();
-        var projectContributions = new Dictionary<long, HashSet<long>>(); // projectId -> set of userIds
-        var mrReviewerCounts = new Dictionary<long, int>(); // mrId -> reviewer count
-        var cycleTimes = new List<decimal>();
+        var windowStartOffset = new DateTimeOffset(windowStart, TimeSpan.Zero);
 
-        foreach (var userId in team.Members)
+        // Fetch every member's contributed projects concurrently
+        var memberProjectTasks = team.Members.Select(async userId =>
         {
             try
             {
                 var userProjects = await _gitLabHttpClient.GetUserContributedProjectsAsync(userId, cancellationToken);
-
-                foreach (var userProject in userProjects)
-                {
-                    var projectId = userProject.Id;
-                    
-                    // Track project contributions
-                    if (!projectContributions.ContainsKey(projectId))
-                    {
-                        projectContributions[projectId] = [];
-                    }
-                    projectContributions[projectId].Add(userId);
-
-                    // Get MRs for this project
-                    var projectMrs = await _gitLabHttpClient.GetMergeRequestsAsync(
-                        projectId,
-                        new DateTimeOffset(windowStart, TimeSpan.Zero),
-                        cancellationToken);
-
-                    // Filter for merged MRs by this user in the window
-                    var userMergedMrs = projectMrs
-                        .Where(mr => mr.Author?.Id == userId &&
-                                   mr.State == "merged" &&
-                                   mr.MergedAt.HasValue &&
-                                   mr.MergedAt.Value >= windowStart &&
-                                   mr.MergedAt.Value <= windowEnd)
-                        .ToList();
-
-                    allMergedMrs.AddRange(userMergedMrs);
-
-                    // Calculate cycle times and review coverage for these MRs
-                    foreach (var mr in userMergedMrs)
-                    {
-                        if (mr.CreatedAt.HasValue && mr.MergedAt.HasValue)
-                        {
-                            var cycleTime = (decimal)(mr.MergedAt.Value - mr.CreatedAt.Value).TotalHours;
-                            if (cycleTime >= 0)
-                            {
-                                cycleTimes.Add(cycleTime);
-                            }
-                        }
-
-                        // Get approvals to count reviewers
-                        var approvals = await _gitLabHttpClient.GetMergeRequestApprovalsAsync(
-                            (int)projectId,
-                            (int)mr.Iid,
-                            cancellationToken);
-
-                        if (approvals is not null)
-                        {
-                            var reviewerCount = approvals.ApprovedBy?.Count ?? 0;
-                            mrReviewerCounts[mr.Id] = reviewerCount;
-                        }
-                    }
-                }
+                return (UserId: userId, Projects: userProjects);
             }
             catch (Exception ex)
             {
                 _logger.LogWarning(ex, "Failed to fetch data for user {UserId} in team {TeamId}", userId, teamId);
+                return (UserId: userId, Projects: (IReadOnlyList<GitLabContributedProject>)Array.Empty<GitLabContributedProject>());
+            }
+        });
+
+        var memberProjects = await Task.WhenAll(memberProjectTasks);
+
+        var projectContributions = new Dictionary<long, HashSet<long>>(); // projectId -> set of userIds
+        foreach (var (userId, userProjects) in memberProjects)
+        {
+            foreach (var userProject in userProjects)
+            {
+                if (!projectContributions.TryGetValue(userProject.Id, out var contributors))
+                {
+                    contributors = [];
+                    projectContributions[userProject.Id] = contributors;
+                }
+
+                contributors.Add(userId);
             }
         }
 
-        // Calculate metrics
-        var totalMergedMrs = allMergedMrs.Count;
-        
-        // Calculate total commits by fetching commits for each project in the window
-        var totalCommits = 0;
-        var projectCommitCounts = new Dictionary<long, int>();
-        
-        foreach (var projectId in projectContributions.Keys)
+        // Fetch MRs and commits for every touched project concurrently. A project shared by several
+        // members is fetched once and its merged MRs are attributed to the contributing members.
+        var projectDataTasks = projectContributions.Select(async kvp =>
         {
-            var projectCommits = await _gitLabHttpClient.GetCommitsAsync(
-                projectId,
-                new DateTimeOffset(windowStart, TimeSpan.Zero),
-                cancellationToken);
-            
+            var projectId = kvp.Key;
+            var contributors = kvp.Value;
+            var commitsTask = _gitLabHttpClient.GetCommitsAsync(projectId, windowStartOffset, cancellationToken);
+
+            IReadOnlyList<GitLabMergeRequest> projectMrs;
+            try
+            {
+                projectMrs = await _gitLabHttpClient.GetMergeRequestsAsync(projectId, windowStartOffset, cancellationToken);
+            }
+            catch (Exception ex)
+            {
+                _logger.LogWarning(ex, "Failed to fetch merge requests for project {ProjectId} in team {TeamId}", projectId, teamId);
+                projectMrs = Array.Empty<GitLabMergeRequest>();
+            }
+
+            // Filter for merged MRs by team members in the window
+            var mergedMrs = projectMrs
+                .Where(mr => mr.Author is not null &&
+                           contributors.Contains(mr.Author.Id) &&
+                           mr.State == "merged" &&
+                           mr.MergedAt.HasValue &&
+                           mr.MergedAt.Value >= windowStart &&
+                           mr.MergedAt.Value <= windowEnd)
+                .ToList();
+
             // Count commits in the window - all commits in team projects count towards team metrics
-            var commitsInWindow = projectCommits.Count(c => 
+            var projectCommits = await commitsTask;
+            var commitsInWindow = projectCommits.Count(c =>
                 c.CommittedDate.HasValue &&
                 c.CommittedDate.Value >= windowStart &&
                 c.CommittedDate.Value <= windowEnd);
-            
-            projectCommitCounts[projectId] = commitsInWindow;
-            totalCommits += commitsInWindow;
-        }
-        
-        // Calculate total lines changed by fetching MR changes for each merged MR
-        var totalLinesChanged = 0;
+
+            return (ProjectId: projectId, MergedMrs: mergedMrs, CommitCount: commitsInWindow);
+        });
+
+        var projectData = await Task.WhenAll(projectDataTasks);
+
+        var allMergedMrs = projectData.SelectMany(p => p.MergedMrs).ToList();
+        var projectCommitCounts = projectData.ToDictionary(p => p.ProjectId, p => p.CommitCount);
+        var projectMergedMrCounts = projectData.ToDictionary(p => p.ProjectId, p => p.MergedMrs.Count);
+        var totalCommits = projectData.Sum(p => p.CommitCount);
+
+        // Calculate metrics
+        var totalMergedMrs = allMergedMrs.Count;
+
+        var cycleTimes = new List<double>();
         foreach (var mr in allMergedMrs)
         {
-            var changes = await _gitLabHttpClient.GetMergeRequestChangesAsync(
-                mr.ProjectId,
-                mr.Iid,
-                cancellationToken);
-            
-            if (changes is not null)
+            if (mr.CreatedAt.HasValue && mr.MergedAt.HasValue)
             {
-                totalLinesChanged += changes.Total;
+                var cycleTime = (mr.MergedAt.Value - mr.CreatedAt.Value).TotalHours;
+                if (cycleTime >= 0)
+                {
+                    cycleTimes.Add(cycleTime);
+                }
             }
         }
 
+        // Fetch approvals (to count reviewers) and changes (for lines changed) for every merged MR concurrently
+        var mrDetailTasks = allMergedMrs.Select(async mr =>
+        {
+            var changesTask = _gitLabHttpClient.GetMergeRequestChangesAsync(mr.ProjectId, mr.Iid, cancellationToken);
+
+            int? reviewerCount = null;
+            try
+            {
+                var approvals = await _gitLabHttpClient.GetMergeRequestApprovalsAsync(mr.ProjectId, mr.Iid, cancellationToken);
+                if (approvals is not null)
+                {
+                    reviewerCount = approvals.ApprovedBy?.Count ?? 0;
+                }
+            }
+            catch (Exception ex)
+            {
+                _logger.LogWarning(ex, "Failed to fetch approvals for MR {MrIid} in project {ProjectId} for team {TeamId}", mr.Iid, mr.ProjectId, teamId);
+            }
+
+            var changes = await changesTask;
+            return (ReviewerCount: reviewerCount, LinesChanged: changes?.Total ?? 0);
+        });
+
+        var mrDetails = await Task.WhenAll(mrDetailTasks);
+
+        var mrReviewerCounts = mrDetails
+            .Where(d => d.ReviewerCount.HasValue)
+            .Select(d => d.ReviewerCount!.Value)
+            .ToList();
+        var totalLinesChanged = mrDetails.Sum(d => d.LinesChanged);
+
         var avgMrCycleTimeP50H = cycleTimes.Any()
-            ? ComputeMedian(cycleTimes)
+            ? (decimal?)MetricsStatistics.SelectMedian(cycleTimes.ToArray())
             : (decimal?)null;
 
         var crossProjectContributors = team.Members.Count(userId =>
@@ -168,7 +184,7 @@ public sealed class TeamMetricsService(
 
         // Calculate review coverage (default minimum: 1 reviewer)
         const int minReviewersRequired = 1;
-        var mrsWithSufficientReviewers = mrReviewerCounts.Count(kvp => kvp.Value >= minReviewersRequired);
+        var mrsWithSufficientReviewers = mrReviewerCounts.Count(count => count >= minReviewersRequired);
         var teamReviewCoveragePercentage = totalMergedMrs > 0
             ? (decimal)mrsWithSufficientReviewers / totalMergedMrs * 100
             : (decimal?)null;
@@ -179,14 +195,13 @@ public sealed class TeamMetricsService(
             {
                 var projectId = kvp.Key;
                 var contributors = kvp.Value;
-                var projectMrs = allMergedMrs.Where(mr => mr.ProjectId == projectId).ToList();
 
                 return new ProjectActivityScore
                 {
                     ProjectId = projectId,
                     ProjectName = projectDict.TryGetValue(projectId, out var p) ? p.PathWithNamespace ?? $"Project-{projectId}" : $"Project-{projectId}",
                     CommitCount = projectCommitCounts.GetValueOrDefault(projectId, 0),
-                    MergedMrCount = projectMrs.Count,
+                    MergedMrCount = projectMergedMrCounts.GetValueOrDefault(projectId, 0),
                     ContributorCount = contributors.Count
                 };
             })
@@ -240,18 +255,4 @@ public sealed class TeamMetricsService(
             ProjectActivities = []
         };
     }
-
-    private static decimal ComputeMedian(List<decimal> values)
-    {
-        var sorted = values.OrderBy(x => x).ToList();
-        var count = sorted.Count;
-
-        if (count == 0)
-            return 0;
-
-        if (count % 2 == 1)
-            return sorted[count / 2];
-
-        return (sorted[count / 2 - 1] + sorted[count / 2]) / 2;
-    }
 }
@@ -1,3 +1,4 @@
+using Microsoft.Extensions.Caching.Memory;
 using Microsoft.Extensions.Logging;
 
 using Moq;
@@ -202,6 +203,477 @@ public sealed class GitLabHttpClientIntegrationTests
         Assert.Equal(15, commits[0].Stats!.Total);
     }
 
+    [Fact]
+    public async Task GetPipelinesAsync_WithItemsOlderThanWindow_StopsAtWindowBoundary()
+    {
+        // Arrange
+        var pipelinesJson = """
+            [
+                {
+                    "id": 2,
+                    "sha": "def456",
+                    "ref": "main",
+                    "status": "success",
+                    "created_at": "2024-01-10T10:00:00Z",
+                    "updated_at": "2024-01-10T10:30:00Z"
+                },
+                {
+                    "id": 1,
+                    "sha": "abc123",
+                    "ref": "main",
+                    "status": "failed",
+                    "created_at": "2023-12-01T10:00:00Z",
+                    "updated_at": "2023-12-01T10:30:00Z"
+                }
+            ]
+            """;
+
+        using var httpClient = new HttpClient(new MockHttpMessageHandler(
+            "/api/v4/projects/1/pipelines",
+            pipelinesJson
+        ))
+        {
+            BaseAddress = new Uri("https://gitlab.example.com/api/v4/")
+        };
+
+        var logger = Mock.Of<ILogger<GitLabHttpClient>>();
+        var gitLabClient = new GitLabHttpClient(httpClient, logger);
+
+        // Act
+        var pipelines = await gitLabClient.GetPipelinesAsync(
+            1,
+            new DateTimeOffset(2024, 1, 1, 0, 0, 0, TimeSpan.Zero),
+            cancellationToken: TestContext.Current.CancellationToken);
+
+        // Assert
+        Assert.Single(pipelines);
+        Assert.Equal(2, pipelines[0].Id);
+    }
+
+    [Fact]
+    public async Task GetProjectsAsync_WithNextLinkHeader_FollowsLinkToNextPage()
+    {
+        // Arrange
+        const string nextPageUrl = "https://gitlab.example.com/api/v4/projects?id_after=1&pagination=keyset&per_page=100";
+        var requestedUrls = new List<string>();
+
+        using var httpClient = new HttpClient(new DelegateHttpMessageHandler(request =>
+        {
+            var url = request.RequestUri!.ToString();
+            requestedUrls.Add(url);
+
+            var isFirstPage = url != nextPageUrl;
+            var response = new HttpResponseMessage(System.Net.HttpStatusCode.OK)
+            {
+                Content = new StringContent(
+                    isFirstPage
+                        ? """[{"id": 1, "path_with_namespace": "group/first"}]"""
+                        : """[{"id": 2, "path_with_namespace": "group/second"}]""",
+                    System.Text.Encoding.UTF8,
+                    "application/json")
+            };
+
+            if (isFirstPage)
+            {
+                response.Headers.Add("Link", $"<{nextPageUrl}>; rel=\"next\"");
+            }
+
+            return response;
+        }))
+        {
+            BaseAddress = new Uri("https://gitlab.example.com/api/v4/")
+        };
+
+        var logger = Mock.Of<ILogger<GitLabHttpClient>>();
+        var gitLabClient = new GitLabHttpClient(httpClient, logger);
+
+        // Act
+        var projects = await gitLabClient.GetProjectsAsync(TestContext.Current.CancellationToken);
+
+        // Assert
+        Assert.Equal(2, projects.Count);
+        Assert.Equal("group/second", projects[1].NameWithNamespace);
+        Assert.Equal(2, requestedUrls.Count);
+        Assert.Contains("pagination=keyset", requestedUrls[0]);
+        Assert.Equal(nextPageUrl, requestedUrls[1]);
+    }
+
+    [Fact]
+    public async Task GetMergeRequestCommitsAsync_WithCache_FetchesCommitStatsOnce()
+    {
+        // Arrange
+        var statsRequestCount = 0;
+
+        using var httpClient = new HttpClient(new DelegateHttpMessageHandler(request =>
+        {
+            var isStatsRequest = request.RequestUri!.AbsolutePath.Contains("/repository/commits/");
+            if (isStatsRequest)
+            {
+                Interlocked.Increment(ref statsRequestCount);
+            }
+
+            return new HttpResponseMessage(System.Net.HttpStatusCode.OK)
+            {
+                Content = new StringContent(
+                    isStatsRequest
+                        ? """{"id": "abc123", "author_name": "Test Author", "author_email": "author@example.com", "committed_date": "2024-01-01T12:00:00Z", "stats": {"additions": 3, "deletions": 1}}"""
+                        : """[{"id": "abc123", "author_name": "Test Author", "author_email": "author@example.com", "committed_date": "2024-01-01T12:00:00Z"}]""",
+                    System.Text.Encoding.UTF8,
+                    "application/json")
+            };
+        }))
+        {
+            BaseAddress = new Uri("https://gitlab.example.com/api/v4/")
+        };
+
+        using var cache = new MemoryCache(new MemoryCacheOptions { SizeLimit = 1_000 });
+        var logger = Mock.Of<ILogger<GitLabHttpClient>>();
+        var gitLabClient = new GitLabHttpClient(httpClient, logger, cache);
+
+        // Act
+        await gitLabClient.GetMergeRequestCommitsAsync(1, 10, TestContext.Current.CancellationToken);
+        var commits = await gitLabClient.GetMergeRequestCommitsAsync(1, 11, TestContext.Current.CancellationToken);
+
+        // Assert
+        Assert.Equal(1, statsRequestCount);
+        Assert.Single(commits);
+        Assert.Equal(4, commits[0].Stats!.Total);
+    }
+
+    [Fact]
+    public async Task GetMergeRequestNotesAsync_WithCache_RevalidatesWithETag()
+    {
+        // Arrange
+        var requestCount = 0;
+        string? lastIfNoneMatch = null;
+
+        using var httpClient = new HttpClient(new DelegateHttpMessageHandler(request =>
+        {
+            Interlocked.Increment(ref requestCount);
+            lastIfNoneMatch = request.Headers.IfNoneMatch.FirstOrDefault()?.Tag;
+
+            if (lastIfNoneMatch == "\"notes-v1\"")
+            {
+                return new HttpResponseMessage(System.Net.HttpStatusCode.NotModified);
+            }
+
+            var response = new HttpResponseMessage(System.Net.HttpStatusCode.OK)
+            {
+                Content = new StringContent(
+                    """[{"id": 1, "body": "Looks good", "system": false, "created_at": "2024-01-01T12:00:00Z"}]""",
+                    System.Text.Encoding.UTF8,
+                    "application/json")
+            };
+            response.Headers.ETag = new System.Net.Http.Headers.EntityTagHeaderValue("\"notes-v1\"");
+            return response;
+        }))
+        {
+            BaseAddress = new Uri("https://gitlab.example.com/api/v4/")
+        };
+
+        using var cache = new MemoryCache(new MemoryCacheOptions { SizeLimit = 1_000 });
+        var logger = Mock.Of<ILogger<GitLabHttpClient>>();
+        var gitLabClient = new GitLabHttpClient(httpClient, logger, cache);
+
+        // Act
+        await gitLabClient.GetMergeRequestNotesAsync(1, 10, TestContext.Current.CancellationToken);
+        var notes = await gitLabClient.GetMergeRequestNotesAsync(1, 10, TestContext.Current.CancellationToken);
+
+        // Assert
+        Assert.Equal(2, requestCount);
+        Assert.Equal("\"notes-v1\"", lastIfNoneMatch);
+        Assert.Single(notes);
+        Assert.Equal("Looks good", notes[0].Body);
+    }
+
+    [Fact]
+    public async Task GetMergeRequestNotesAsync_WithMultiplePages_FollowsNextLink()
+    {
+        // Arrange
+        var requestedUrls = new List<string>();
+
+        using var httpClient = new HttpClient(new DelegateHttpMessageHandler(request =>
+        {
+            var url = request.RequestUri!.ToString();
+            lock (requestedUrls)
+            {
+                requestedUrls.Add(url);
+            }
+
+            if (url.Contains("page=2"))
+            {
+                return new HttpResponseMessage(System.Net.HttpStatusCode.OK)
+                {
+                    Content = new StringContent(
+                        """[{"id": 2, "body": "Second page", "system": false, "created_at": "2024-01-02T12:00:00Z"}]""",
+                        System.Text.Encoding.UTF8,
+                        "application/json")
+                };
+            }
+
+            var response = new HttpResponseMessage(System.Net.HttpStatusCode.OK)
+            {
+                Content = new StringContent(
+                    """[{"id": 1, "body": "First page", "system": false, "created_at": "2024-01-01T12:00:00Z"}]""",
+                    System.Text.Encoding.UTF8,
+                    "application/json")
+            };
+            response.Headers.Add("Link", "<https://gitlab.example.com/api/v4/projects/1/merge_requests/10/notes?order_by=created_at&sort=asc&page=2&per_page=100>; rel=\"next\"");
+            return response;
+        }))
+        {
+            BaseAddress = new Uri("https://gitlab.example.com/api/v4/")
+        };
+
+        var logger = Mock.Of<ILogger<GitLabHttpClient>>();
+        var gitLabClient = new GitLabHttpClient(httpClient, logger);
+
+        // Act
+        var notes = await gitLabClient.GetMergeRequestNotesAsync(1, 10, TestContext.Current.CancellationToken);
+
+        // Assert
+        Assert.Equal(2, requestedUrls.Count);
+        Assert.Contains("sort=asc", requestedUrls[0]);
+        Assert.Equal(new[] { "First page", "Second page" }, notes.Select(n => n.Body).ToArray());
+    }
+
+    [Fact]
+    public async Task GetProjectJobsAsync_WithFailureOnLaterPage_Throws()
+    {
+        // Arrange
+        using var httpClient = new HttpClient(new DelegateHttpMessageHandler(request =>
+        {
+            if (request.RequestUri!.Query.Contains("id_before"))
+            {
+                return new HttpResponseMessage(System.Net.HttpStatusCode.InternalServerError);
+            }
+
+            var response = new HttpResponseMessage(System.Net.HttpStatusCode.OK)
+            {
+                Content = new StringContent(
+                    """[{"id": 2, "name": "build", "status": "success", "stage": "build", "created_at": "2024-01-01T12:00:00Z", "pipeline": {"id": 1}}]""",
+                    System.Text.Encoding.UTF8,
+                    "application/json")
+            };
+            response.Headers.Add("Link", "<https://gitlab.example.com/api/v4/projects/1/jobs?id_before=2&order_by=id&pagination=keyset&per_page=100&sort=desc>; rel=\"next\"");
+            return response;
+        }))
+        {
+            BaseAddress = new Uri("https://gitlab.example.com/api/v4/")
+        };
+
+        var logger = Mock.Of<ILogger<GitLabHttpClient>>();
+        var gitLabClient = new GitLabHttpClient(httpClient, logger);
+
+        // Act & Assert: the first page must not be reported as the project's complete job list
+        await Assert.ThrowsAsync<HttpRequestException>(
+            () => gitLabClient.GetProjectJobsAsync(1, cancellationToken: TestContext.Current.CancellationToken));
+    }
+
+    [Fact]
+    public async Task GetMergeRequestDiscussionsAsync_WithCache_ReusesNotModifiedPage()
+    {
+        // Arrange
+        var notModifiedCount = 0;
+
+        using var httpClient = new HttpClient(new DelegateHttpMessageHandler(request =>
+        {
+            if (request.Headers.IfNoneMatch.Any(etag => etag.Tag == "\"discussions-v1\""))
+            {
+                Interlocked.Increment(ref notModifiedCount);
+                return new HttpResponseMessage(System.Net.HttpStatusCode.NotModified);
+            }
+
+            var response = new HttpResponseMessage(System.Net.HttpStatusCode.OK)
+            {
+                Content = new StringContent(
+                    """[{"id": "d1", "individual_note": true, "notes": [{"id": 1, "body": "Please rename", "system": false}]}]""",
+                    System.Text.Encoding.UTF8,
+                    "application/json")
+            };
+            response.Headers.ETag = new System.Net.Http.Headers.EntityTagHeaderValue("\"discussions-v1\"");
+            return response;
+        }))
+        {
+            BaseAddress = new Uri("https://gitlab.example.com/api/v4/")
+        };
+
+        using var cache = new MemoryCache(new MemoryCacheOptions { SizeLimit = 1_000 });
+        var logger = Mock.Of<ILogger<GitLabHttpClient>>();
+        var gitLabClient = new GitLabHttpClient(httpClient, logger, cache);
+
+        // Act
+        await gitLabClient.GetMergeRequestDiscussionsAsync(1, 10, TestContext.Current.CancellationToken);
+        var discussions = await gitLabClient.GetMergeRequestDiscussionsAsync(1, 10, TestContext.Current.CancellationToken);
+
+        // Assert
+        Assert.Equal(1, notModifiedCount);
+        Assert.Single(discussions);
+        Assert.Equal("d1", discussions[0].Id);
+    }
+
+    [Fact]
+    public async Task GetMergeRequestChangesAsync_UsesChangesCountWithoutDownloadingDiff()
+    {
+        // Arrange
+        var requestedPaths = new System.Collections.Concurrent.ConcurrentBag<string>();
+
+        using var httpClient = new HttpClient(new DelegateHttpMessageHandler(request =>
+        {
+            requestedPaths.Add(request.RequestUri!.AbsolutePath);
+
+            return new HttpResponseMessage(System.Net.HttpStatusCode.OK)
+            {
+                Content = new StringContent(
+                    """{"id": 100, "iid": 10, "project_id": 1, "state": "merged", "changes_count": "1000+"}""",
+                    System.Text.Encoding.UTF8,
+                    "application/json")
+            };
+        }))
+        {
+            BaseAddress = new Uri("https://gitlab.example.com/api/v4/")
+        };
+
+        var logger = Mock.Of<ILogger<GitLabHttpClient>>();
+        var gitLabClient = new GitLabHttpClient(httpClient, logger);
+
+        // Act
+        var changes = await gitLabClient.GetMergeRequestChangesAsync(1, 10, TestContext.Current.CancellationToken);
+
+        // Assert
+        Assert.NotNull(changes);
+        Assert.Equal(1000, changes.FileCount);
+        Assert.Equal(0, changes.Total);
+        Assert.Null(changes.Changes);
+        Assert.Equal("/api/v4/projects/1/merge_requests/10", Assert.Single(requestedPaths));
+    }
+
+    [Fact]
+    public async Task GetMergeRequestChangesAsync_WithCache_RevalidatesWithETag()
+    {
+        // Arrange
+        var requestCount = 0;
+        string? lastIfNoneMatch = null;
+
+        using var httpClient = new HttpClient(new DelegateHttpMessageHandler(request =>
+        {
+            Interlocked.Increment(ref requestCount);
+            lastIfNoneMatch = request.Headers.IfNoneMatch.FirstOrDefault()?.Tag;
+
+            if (lastIfNoneMatch == "\"mr-v1\"")
+            {
+                return new HttpResponseMessage(System.Net.HttpStatusCode.NotModified);
+            }
+
+            var response = new HttpResponseMessage(System.Net.HttpStatusCode.OK)
+            {
+                Content = new StringContent(
+                    """{"id": 100, "iid": 10, "project_id": 1, "state": "merged", "changes_count": "12"}""",
+                    System.Text.Encoding.UTF8,
+                    "application/json")
+            };
+            response.Headers.ETag = new System.Net.Http.Headers.EntityTagHeaderValue("\"mr-v1\"");
+            return response;
+        }))
+        {
+            BaseAddress = new Uri("https://gitlab.example.com/api/v4/")
+        };
+
+        using var cache = new MemoryCache(new MemoryCacheOptions { SizeLimit = 1_000 });
+        var logger = Mock.Of<ILogger<GitLabHttpClient>>();
+        var gitLabClient = new GitLabHttpClient(httpClient, logger, cache);
+
+        // Act
+        await gitLabClient.GetMergeRequestChangesAsync(1, 10, TestContext.Current.CancellationToken);
+        var changes = await gitLabClient.GetMergeRequestChangesAsync(1, 10, TestContext.Current.CancellationToken);
+
+        // Assert
+        Assert.Equal(2, requestCount);
+        Assert.Equal("\"mr-v1\"", lastIfNoneMatch);
+        Assert.NotNull(changes);
+        Assert.Equal(12, changes.FileCount);
+    }
+
+    [Fact]
+    public async Task GetMergeRequestChangesAsync_WithoutChangesCount_FallsBackToChangedFiles()
+    {
+        // Arrange
+        using var httpClient = new HttpClient(new DelegateHttpMessageHandler(request =>
+        {
+            var content = request.RequestUri!.AbsolutePath.EndsWith("/changes")
+                ? """
+                  {
+                      "changes": [
+                          {"old_path": "a.cs", "new_path": "a.cs", "new_file": false, "renamed_file": false, "deleted_file": false, "diff": "@@ -1 +1 @@\n-old\n+new\n"},
+                          {"old_path": null, "new_path": "b.cs", "new_file": true, "renamed_file": false, "deleted_file": false, "diff": ""}
+                      ]
+                  }
+                  """
+                : """{"id": 100, "iid": 10, "project_id": 1, "state": "opened", "changes_count": null}""";
+
+            return new HttpResponseMessage(System.Net.HttpStatusCode.OK)
+            {
+                Content = new StringContent(content, System.Text.Encoding.UTF8, "application/json")
+            };
+        }))
+        {
+            BaseAddress = new Uri("https://gitlab.example.com/api/v4/")
+        };
+
+        var logger = Mock.Of<ILogger<GitLabHttpClient>>();
+        var gitLabClient = new GitLabHttpClient(httpClient, logger);
+
+        // Act
+        var changes = await gitLabClient.GetMergeRequestChangesAsync(1, 10, TestContext.Current.CancellationToken);
+
+        // Assert
+        Assert.NotNull(changes);
+        Assert.Equal(2, changes.FileCount);
+        Assert.Equal(2, changes.Changes!.Count);
+        Assert.True(changes.Changes[1].NewFile);
+    }
+
+    [Fact]
+    public async Task GetMergeRequestChangesAsync_WithNotFound_ReturnsNull()
+    {
+        // Arrange
+        using var httpClient = new HttpClient(new MockHttpMessageHandler(
+            "/api/v4/projects/1/merge_requests/10",
+            "",
+            System.Net.HttpStatusCode.NotFound
+        ))
+        {
+            BaseAddress = new Uri("https://gitlab.example.com/api/v4/")
+        };
+
+        var logger = Mock.Of<ILogger<GitLabHttpClient>>();
+        var gitLabClient = new GitLabHttpClient(httpClient, logger);
+
+        // Act
+        var changes = await gitLabClient.GetMergeRequestChangesAsync(1, 10, TestContext.Current.CancellationToken);
+
+        // Assert
+        Assert.Null(changes);
+    }
+
+    /// <summary>
+    /// Mock HTTP message handler that builds each response from the incoming request
+    /// </summary>
+    private sealed class DelegateHttpMessageHandler : HttpMessageHandler
+    {
+        private readonly Func<HttpRequestMessage, HttpResponseMessage> _respond;
+
+        public DelegateHttpMessageHandler(Func<HttpRequestMessage, HttpResponseMessage> respond)
+        {
+            _respond = respond;
+        }
+
+        protected override Task<HttpResponseMessage> SendAsync(HttpRequestMessage request, CancellationToken cancellationToken)
+        {
+            return Task.FromResult(_respond(request));
+        }
+    }
+
     /// <summary>
     /// Mock HTTP message handler for testing HTTP client interactions
     /// </summary>
@@ -0,0 +1,19 @@
+namespace KuriousLabs.Management.KPIAnalysis.Tests.TestFixtures;
+
+/// <summary>
+/// Helpers for stubbing the streaming (IAsyncEnumerable) members of the GitLab client in unit tests.
+/// </summary>
+public static class AsyncEnumerableTestHelpers
+{
+    /// <summary>
+    /// Yields the given items asynchronously, one at a time, as a streamed GitLab listing would
+    /// </summary>
+    public static async IAsyncEnumerable<T> ToAsyncEnumerable<T>(IEnumerable<T> items)
+    {
+        foreach (var item in items)
+        {
+            await Task.Yield();
+            yield return item;
+        }
+    }
+}
@@ -7,6 +7,7 @@ using KuriousLabs.Management.KPIAnalysis.ApiService.Configuration;
 using KuriousLabs.Management.KPIAnalysis.ApiService.Features.GitLabMetrics.Infrastructure;
 using KuriousLabs.Management.KPIAnalysis.ApiService.Features.GitLabMetrics.Models.Raw;
 using KuriousLabs.Management.KPIAnalysis.ApiService.Features.GitLabMetrics.Services;
+using static KuriousLabs.Management.KPIAnalysis.Tests.TestFixtures.AsyncEnumerableTestHelpers;
 
 namespace KuriousLabs.Management.KPIAnalysis.Tests.Unit;
 
@@ -152,8 +153,8 @@ public sealed class CollaborationMetricsServiceTests
             .ReturnsAsync(user);
         mockHttpClient.Setup(c => c.GetUserContributedProjectsAsync(userId, It.IsAny<CancellationToken>()))
             .ReturnsAsync(new[] { project });
-        mockHttpClient.Setup(c => c.GetMergeRequestsAsync(100, It.IsAny<DateTimeOffset>(), It.IsAny<CancellationToken>()))
-            .ReturnsAsync(new[] { mr });
+        mockHttpClient.Setup(c => c.StreamMergeRequestsAsync(100, It.IsAny<DateTimeOffset?>(), It.IsAny<CancellationToken>()))
+            .Returns(ToAsyncEnumerable(new[] { mr }));
         mockHttpClient.Setup(c => c.GetMergeRequestNotesAsync(100, 1, It.IsAny<CancellationToken>()))
             .ReturnsAsync(notes);
         mockHttpClient.Setup(c => c.GetMergeRequestDiscussionsAsync(100, 1, It.IsAny<CancellationToken>()))
@@ -280,8 +281,8 @@ public sealed class CollaborationMetricsServiceTests
             .ReturnsAsync(user);
         mockHttpClient.Setup(c => c.GetUserContributedProjectsAsync(userId, It.IsAny<CancellationToken>()))
             .ReturnsAsync(new[] { project });
-        mockHttpClient.Setup(c => c.GetMergeRequestsAsync(100, It.IsAny<DateTimeOffset>(), It.IsAny<CancellationToken>()))
-            .ReturnsAsync(new[] { selfMergedMr, reviewedMr });
+        mockHttpClient.Setup(c => c.StreamMergeRequestsAsync(100, It.IsAny<DateTimeOffset?>(), It.IsAny<CancellationToken>()))
+            .Returns(ToAsyncEnumerable(new[] { selfMergedMr, reviewedMr }));
         mockHttpClient.Setup(c => c.GetMergeRequestNotesAsync(100, 1, It.IsAny<CancellationToken>()))
             .ReturnsAsync(selfMergedNotes);
         mockHttpClient.Setup(c => c.GetMergeRequestNotesAsync(100, 2, It.IsAny<CancellationToken>()))
@@ -425,8 +426,8 @@ public sealed class CollaborationMetricsServiceTests
             .ReturnsAsync(user);
         mockHttpClient.Setup(c => c.GetUserContributedProjectsAsync(userId, It.IsAny<CancellationToken>()))
             .ReturnsAsync(new[] { project });
-        mockHttpClient.Setup(c => c.GetMergeRequestsAsync(100, It.IsAny<DateTimeOffset>(), It.IsAny<CancellationToken>()))
-            .ReturnsAsync(new[] { mr });
+        mockHttpClient.Setup(c => c.StreamMergeRequestsAsync(100, It.IsAny<DateTimeOffset?>(), It.IsAny<CancellationToken>()))
+            .Returns(ToAsyncEnumerable(new[] { mr }));
         mockHttpClient.Setup(c => c.GetMergeRequestNotesAsync(100, 1, It.IsAny<CancellationToken>()))
             .ReturnsAsync(discussions.SelectMany(d => d.Notes ?? new List<GitLabMergeRequestNote>()).ToList());
         mockHttpClient.Setup(c => c.GetMergeRequestDiscussionsAsync(100, 1, It.IsAny<CancellationToken>()))
@@ -523,8 +524,8 @@ public sealed class CollaborationMetricsServiceTests
             .ReturnsAsync(user);
         mockHttpClient.Setup(c => c.GetUserContributedProjectsAsync(userId, It.IsAny<CancellationToken>()))
             .ReturnsAsync(new[] { project });
-        mockHttpClient.Setup(c => c.GetMergeRequestsAsync(100, It.IsAny<DateTimeOffset>(), It.IsAny<CancellationToken>()))
-            .ReturnsAsync(new[] { mr });
+        mockHttpClient.Setup(c => c.StreamMergeRequestsAsync(100, It.IsAny<DateTimeOffset?>(), It.IsAny<CancellationToken>()))
+            .Returns(ToAsyncEnumerable(new[] { mr }));
         mockHttpClient.Setup(c => c.GetMergeRequestNotesAsync(100, 1, It.IsAny<CancellationToken>()))
             .ReturnsAsync(Array.Empty<GitLabMergeRequestNote>());
         mockHttpClient.Setup(c => c.GetMergeRequestDiscussionsAsync(100, 1, It.IsAny<CancellationToken>()))
@@ -635,8 +636,8 @@ public sealed class CollaborationMetricsServiceTests
             .ReturnsAsync(user);
         mockHttpClient.Setup(c => c.GetUserContributedProjectsAsync(userId, It.IsAny<CancellationToken>()))
             .ReturnsAsync(new[] { project });
-        mockHttpClient.Setup(c => c.GetMergeRequestsAsync(100, It.IsAny<DateTimeOffset>(), It.IsAny<CancellationToken>()))
-            .ReturnsAsync(new[] { mr });
+        mockHttpClient.Setup(c => c.StreamMergeRequestsAsync(100, It.IsAny<DateTimeOffset?>(), It.IsAny<CancellationToken>()))
+            .Returns(ToAsyncEnumerable(new[] { mr }));
         mockHttpClient.Setup(c => c.GetMergeRequestNotesAsync(100, 1, It.IsAny<CancellationToken>()))
             .ReturnsAsync(notes);
         mockHttpClient.Setup(c => c.GetMergeRequestDiscussionsAsync(100, 1, It.IsAny<CancellationToken>()))
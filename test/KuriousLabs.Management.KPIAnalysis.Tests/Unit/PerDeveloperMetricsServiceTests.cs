@@ -5,6 +5,7 @@ using Moq;
 using KuriousLabs.Management.KPIAnalysis.ApiService.Features.GitLabMetrics.Infrastructure;
 using KuriousLabs.Management.KPIAnalysis.ApiService.Features.GitLabMetrics.Models.Raw;
 using KuriousLabs.Management.KPIAnalysis.ApiService.Features.GitLabMetrics.Services;
+using static KuriousLabs.Management.KPIAnalysis.Tests.TestFixtures.AsyncEnumerableTestHelpers;
 
 namespace KuriousLabs.Management.KPIAnalysis.Tests.Unit;
 
@@ -539,12 +540,12 @@ public sealed class PerDeveloperMetricsServiceTests
             .ReturnsAsync(new List<GitLabContributedProject> { project1, project2 });
 
         mockGitLabClient
-            .Setup(x => x.GetMergeRequestsAsync(100, It.IsAny<DateTimeOffset>(), It.IsAny<CancellationToken>()))
-            .ReturnsAsync(new List<GitLabMergeRequest> { mr1, mr3 });
+            .Setup(x => x.StreamMergeRequestsAsync(100, It.IsAny<DateTimeOffset?>(), It.IsAny<CancellationToken>()))
+            .Returns(ToAsyncEnumerable(new[] { mr1, mr3 }));
 
         mockGitLabClient
-            .Setup(x => x.GetMergeRequestsAsync(200, It.IsAny<DateTimeOffset>(), It.IsAny<CancellationToken>()))
-            .ReturnsAsync(new List<GitLabMergeRequest> { mr2 });
+            .Setup(x => x.StreamMergeRequestsAsync(200, It.IsAny<DateTimeOffset?>(), It.IsAny<CancellationToken>()))
+            .Returns(ToAsyncEnumerable(new[] { mr2 }));
 
         mockGitLabClient
             .Setup(x => x.GetMergeRequestCommitsAsync(100, 1, It.IsAny<CancellationToken>()))
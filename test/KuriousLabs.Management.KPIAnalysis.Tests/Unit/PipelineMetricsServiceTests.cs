@@ -5,6 +5,7 @@ using Moq;
 using KuriousLabs.Management.KPIAnalysis.ApiService.Features.GitLabMetrics.Infrastructure;
 using KuriousLabs.Management.KPIAnalysis.ApiService.Features.GitLabMetrics.Models.Raw;
 using KuriousLabs.Management.KPIAnalysis.ApiService.Features.GitLabMetrics.Services;
+using static KuriousLabs.Management.KPIAnalysis.Tests.TestFixtures.AsyncEnumerableTestHelpers;
 
 namespace KuriousLabs.Management.KPIAnalysis.Tests.Unit;
 
@@ -56,8 +57,12 @@ public sealed class PipelineMetricsServiceTests
             .ReturnsAsync(project);
 
         mockGitLabClient
-            .Setup(x => x.GetPipelinesAsync(projectId, It.IsAny<DateTimeOffset>(), It.IsAny<CancellationToken>()))
-            .ReturnsAsync(new List<GitLabPipeline>());
+            .Setup(x => x.StreamPipelinesAsync(projectId, It.IsAny<DateTimeOffset>(), It.IsAny<string?>(), It.IsAny<CancellationToken>()))
+            .Returns(ToAsyncEnumerable(new List<GitLabPipeline>()));
+
+        mockGitLabClient
+            .Setup(x => x.GetProjectJobsAsync(projectId, It.IsAny<DateTimeOffset?>(), It.IsAny<CancellationToken>()))
+            .ReturnsAsync(new List<GitLabPipelineJob>());
 
         var logger = Mock.Of<ILogger<PipelineMetricsService>>();
         var service = new PipelineMetricsService(mockGitLabClient.Object, logger);
@@ -252,20 +257,12 @@ public sealed class PipelineMetricsServiceTests
             .ReturnsAsync(project);
 
         mockGitLabClient
-            .Setup(x => x.GetPipelinesAsync(projectId, It.IsAny<DateTimeOffset>(), It.IsAny<CancellationToken>()))
-            .ReturnsAsync(pipelines);
-
-        mockGitLabClient
-            .Setup(x => x.GetPipelineJobsAsync(projectId, 1, It.IsAny<CancellationToken>()))
-            .ReturnsAsync(jobsPipeline1);
-
-        mockGitLabClient
-            .Setup(x => x.GetPipelineJobsAsync(projectId, 2, It.IsAny<CancellationToken>()))
-            .ReturnsAsync(jobsPipeline2);
+            .Setup(x => x.StreamPipelinesAsync(projectId, It.IsAny<DateTimeOffset>(), It.IsAny<string?>(), It.IsAny<CancellationToken>()))
+            .Returns(ToAsyncEnumerable(pipelines));
 
         mockGitLabClient
-            .Setup(x => x.GetPipelineJobsAsync(projectId, 3, It.IsAny<CancellationToken>()))
-            .ReturnsAsync(jobsPipeline3);
+            .Setup(x => x.GetProjectJobsAsync(projectId, It.IsAny<DateTimeOffset?>(), It.IsAny<CancellationToken>()))
+            .ReturnsAsync(jobsPipeline1.Concat(jobsPipeline2).Concat(jobsPipeline3).ToList());
 
         var logger = Mock.Of<ILogger<PipelineMetricsService>>();
         var service = new PipelineMetricsService(mockGitLabClient.Object, logger);
@@ -370,11 +367,11 @@ public sealed class PipelineMetricsServiceTests
             .ReturnsAsync(project);
 
         mockGitLabClient
-            .Setup(x => x.GetPipelinesAsync(projectId, It.IsAny<DateTimeOffset>(), It.IsAny<CancellationToken>()))
-            .ReturnsAsync(pipelines);
+            .Setup(x => x.StreamPipelinesAsync(projectId, It.IsAny<DateTimeOffset>(), It.IsAny<string?>(), It.IsAny<CancellationToken>()))
+            .Returns(ToAsyncEnumerable(pipelines));
 
         mockGitLabClient
-            .Setup(x => x.GetPipelineJobsAsync(projectId, 1, It.IsAny<CancellationToken>()))
+            .Setup(x => x.GetProjectJobsAsync(projectId, It.IsAny<DateTimeOffset?>(), It.IsAny<CancellationToken>()))
             .ThrowsAsync(new Exception("Failed to fetch jobs"));
 
         var logger = Mock.Of<ILogger<PipelineMetricsService>>();
@@ -429,11 +426,11 @@ public sealed class PipelineMetricsServiceTests
             .ReturnsAsync(project);
 
         mockGitLabClient
-            .Setup(x => x.GetPipelinesAsync(projectId, It.IsAny<DateTimeOffset>(), It.IsAny<CancellationToken>()))
-            .ReturnsAsync(pipelines);
+            .Setup(x => x.StreamPipelinesAsync(projectId, It.IsAny<DateTimeOffset>(), It.IsAny<string?>(), It.IsAny<CancellationToken>()))
+            .Returns(ToAsyncEnumerable(pipelines));
 
         mockGitLabClient
-            .Setup(x => x.GetPipelineJobsAsync(projectId, 1, It.IsAny<CancellationToken>()))
+            .Setup(x => x.GetProjectJobsAsync(projectId, It.IsAny<DateTimeOffset?>(), It.IsAny<CancellationToken>()))
             .ReturnsAsync(new List<GitLabPipelineJob>());
 
         var logger = Mock.Of<ILogger<PipelineMetricsService>>();
@@ -448,4 +445,86 @@ public sealed class PipelineMetricsServiceTests
         Assert.Null(result.CoverageTrend);
         Assert.Equal(0, result.PipelinesWithCoverageCount);
     }
+
+    [Fact]
+    public async Task CalculatePipelineMetricsAsync_WithRetriedJob_CountsOnlyLatestAttempt()
+    {
+        // Arrange
+        const long projectId = 100;
+        const int windowDays = 30;
+        var now = DateTime.UtcNow;
+
+        var project = new GitLabProject
+        {
+            Id = projectId,
+            Name = "TestProject",
+            DefaultBranch = "main"
+        };
+
+        var pipelines = new List<GitLabPipeline>
+        {
+            new()
+            {
+                Id = 1,
+                ProjectId = projectId,
+                Sha = "abc123",
+                Ref = "main",
+                Status = "success",
+                CreatedAt = now.AddDays(-5),
+                UpdatedAt = now.AddDays(-5).AddMinutes(30)
+            }
+        };
+
+        GitLabPipelineJob CreateJob(long id, string name, string status, long pipelineId, int minutesAfterPipeline) => new()
+        {
+            Id = id,
+            Name = name,
+            Status = status,
+            Stage = "test",
+            CreatedAt = now.AddDays(-5).AddMinutes(minutesAfterPipeline),
+            StartedAt = now.AddDays(-5).AddMinutes(minutesAfterPipeline),
+            FinishedAt = now.AddDays(-5).AddMinutes(minutesAfterPipeline + 5),
+            Duration = 300.0,
+            PipelineId = pipelineId,
+            ProjectId = projectId,
+            Sha = "abc123",
+            Ref = "main",
+            AllowFailure = false,
+            Tag = false
+        };
+
+        // The project jobs listing returns newest first and includes superseded attempts
+        var jobs = new List<GitLabPipelineJob>
+        {
+            CreateJob(20, "lint", "failed", 99, 0), // Pipeline outside the window
+            CreateJob(12, "test", "success", 1, 10), // Retry that passed
+            CreateJob(11, "build", "success", 1, 0),
+            CreateJob(10, "test", "failed", 1, 1) // Superseded by the retry
+        };
+
+        var mockGitLabClient = new Mock<IGitLabHttpClient>();
+
+        mockGitLabClient
+            .Setup(x => x.GetProjectByIdAsync(projectId, It.IsAny<CancellationToken>()))
+            .ReturnsAsync(project);
+
+        mockGitLabClient
+            .Setup(x => x.StreamPipelinesAsync(projectId, It.IsAny<DateTimeOffset>(), It.IsAny<string?>(), It.IsAny<CancellationToken>()))
+            .Returns(ToAsyncEnumerable(pipelines));
+
+        mockGitLabClient
+            .Setup(x => x.GetProjectJobsAsync(projectId, It.IsAny<DateTimeOffset?>(), It.IsAny<CancellationToken>()))
+            .ReturnsAsync(jobs);
+
+        var logger = Mock.Of<ILogger<PipelineMetricsService>>();
+        var service = new PipelineMetricsService(mockGitLabClient.Object, logger);
+
+        // Act
+        var result = await service.CalculatePipelineMetricsAsync(projectId, windowDays, TestContext.Current.CancellationToken);
+
+        // Assert
+        // Neither the superseded failed attempt nor the out-of-window pipeline's job counts as a failure
+        Assert.Empty(result.FailedJobs);
+        Assert.Equal(1, result.TotalPipelineCount);
+    }
 }
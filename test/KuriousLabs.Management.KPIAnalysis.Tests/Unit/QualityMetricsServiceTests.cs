@@ -221,7 +221,7 @@ public sealed class QualityMetricsServiceTests
             .ReturnsAsync(mergeRequests);
 
         mockGitLabClient
-            .Setup(x => x.GetPipelinesAsync(projectId, It.IsAny<DateTimeOffset>(), It.IsAny<CancellationToken>()))
+            .Setup(x => x.GetPipelinesAsync(projectId, It.IsAny<DateTimeOffset>(), It.IsAny<string?>(), It.IsAny<CancellationToken>()))
             .ReturnsAsync(pipelines);
 
         // Mock GetMergeRequestCommitsAsync and GetMergeRequestNotesAsync for rework calculation
@@ -331,7 +331,7 @@ public sealed class QualityMetricsServiceTests
             .ReturnsAsync(mergeRequests);
 
         mockGitLabClient
-            .Setup(x => x.GetPipelinesAsync(projectId, It.IsAny<DateTimeOffset>(), It.IsAny<CancellationToken>()))
+            .Setup(x => x.GetPipelinesAsync(projectId, It.IsAny<DateTimeOffset>(), It.IsAny<string?>(), It.IsAny<CancellationToken>()))
             .ReturnsAsync(new List<GitLabPipeline>());
 
         mockGitLabClient
@@ -451,7 +451,7 @@ public sealed class QualityMetricsServiceTests
             .ReturnsAsync(mergeRequests);
 
         mockGitLabClient
-            .Setup(x => x.GetPipelinesAsync(projectId, It.IsAny<DateTimeOffset>(), It.IsAny<CancellationToken>()))
+            .Setup(x => x.GetPipelinesAsync(projectId, It.IsAny<DateTimeOffset>(), It.IsAny<string?>(), It.IsAny<CancellationToken>()))
             .ReturnsAsync(new List<GitLabPipeline>());
 
         mockGitLabClient
@@ -473,4 +473,85 @@ public sealed class QualityMetricsServiceTests
         Assert.Equal(1.0m, result.HotfixRate); // 1 out of 1 is hotfix
         Assert.Equal(1, result.HotfixMrCount);
     }
+
+    [Fact]
+    public async Task CalculateQualityMetricsAsync_WithPipelinesWithoutUser_UsesServerSideUsernameFilter()
+    {
+        // Arrange: GitLab's list-pipelines payload has no user object, only the username query filter selects them
+        const long userId = 1;
+        const long projectId = 100;
+        const int windowDays = 30;
+
+        var user = new GitLabUser
+        {
+            Id = userId,
+            Username = "testuser",
+            Name = "Test User",
+            Email = "test@example.com"
+        };
+
+        var project = new GitLabContributedProject
+        {
+            Id = projectId,
+            Name = "test-project"
+        };
+
+        var now = DateTime.UtcNow;
+        var pipelines = new List<GitLabPipeline>
+        {
+            new()
+            {
+                Id = 2,
+                ProjectId = projectId,
+                Sha = "def456",
+                Ref = "main",
+                Status = "failed",
+                CreatedAt = now.AddDays(-2),
+                UpdatedAt = now.AddDays(-2)
+            },
+            new()
+            {
+                Id = 1,
+                ProjectId = projectId,
+                Sha = "abc123",
+                Ref = "main",
+                Status = "success",
+                CreatedAt = now.AddDays(-3),
+                UpdatedAt = now.AddDays(-3)
+            }
+        };
+
+        var mockGitLabClient = new Mock<IGitLabHttpClient>();
+
+        mockGitLabClient
+            .Setup(x => x.GetUserByIdAsync(userId, It.IsAny<CancellationToken>()))
+            .ReturnsAsync(user);
+
+        mockGitLabClient
+            .Setup(x => x.GetUserContributedProjectsAsync(userId, It.IsAny<CancellationToken>()))
+            .ReturnsAsync(new List<GitLabContributedProject> { project });
+
+        mockGitLabClient
+            .Setup(x => x.GetMergeRequestsAsync(projectId, It.IsAny<DateTimeOffset>(), It.IsAny<CancellationToken>()))
+            .ReturnsAsync(new List<GitLabMergeRequest>());
+
+        mockGitLabClient
+            .Setup(x => x.GetPipelinesAsync(projectId, It.IsAny<DateTimeOffset>(), "testuser", It.IsAny<CancellationToken>()))
+            .ReturnsAsync(pipelines);
+
+        var logger = Mock.Of<ILogger<QualityMetricsService>>();
+        var service = new QualityMetricsService(mockGitLabClient.Object, logger);
+
+        // Act
+        var result = await service.CalculateQualityMetricsAsync(userId, windowDays, 30, TestContext.Current.CancellationToken);
+
+        // Assert
+        mockGitLabClient.Verify(
+            x => x.GetPipelinesAsync(projectId, It.IsAny<DateTimeOffset>(), "testuser", It.IsAny<CancellationToken>()),
+            Times.Once);
+        Assert.Equal(2, result.TotalFirstRunPipelines);
+        Assert.Equal(1, result.SuccessfulPipelinesFirstRun);
+        Assert.Single(result.Projects);
+        Assert.Equal(2, result.Projects[0].PipelineCount);
+    }
 }